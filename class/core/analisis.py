@@ -177,8 +177,8 @@ class AndroidForensicAnalysis:
         self.device_id = detect_device()
         print(f"[OK] Dispositivo detectado: {self.device_id}")
 
-        # Asegurar que carpetas existen (por si nos llaman desde la GUI)
-        self.case_dir.mkdir(parents=True, exist_ok=True)
+        # Asegurar que carpetas existen (por si nos llaman desde la GUI);
+        # logs_dir cuelga de case_dir, así que basta un mkdir con parents
         self.logs_dir.mkdir(parents=True, exist_ok=True)
 
         print("\n[*] Guardando información básica del dispositivo...")
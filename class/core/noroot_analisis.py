@@ -30,6 +30,7 @@ Limitaciones:
 - Algunas órdenes dumpsys/cmd pueden devolver "Permission denial" según la ROM.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional, Tuple, List, Dict, Any
@@ -54,6 +55,10 @@ from PySide6.QtWidgets import (  # se usa en la GUI principal
     QCheckBox, QGroupBox, QLabel
 )
 
+# Consultas adb shell que se lanzan a la vez en extract_all (cada una
+# escribe su propio archivo; adb multiplexa varios shell por conexión).
+_ADB_WORKERS = 4
+
 # ------------------------------------------------------------
 # Opciones NO-ROOT seleccionables
 # ------------------------------------------------------------
@@ -791,6 +796,17 @@ class NoRootExtractor:
         except Exception:
             return None
 
+    def _run_parallel(self, tasks: List[Callable[[], None]]) -> None:
+        """
+        Ejecuta `tasks` en un pool de _ADB_WORKERS hilos (trabajo de E/S:
+        esperar a adb). Si alguna falla, se relanza su excepción cuando
+        terminan las demás, igual que fallaría la secuencia original.
+        """
+        with ThreadPoolExecutor(max_workers=_ADB_WORKERS) as pool:
+            futures = [pool.submit(t) for t in tasks]
+            for fut in as_completed(futures):
+                fut.result()
+
     # --------------------------------------------------------
     # Flujo principal NO-ROOT (sólo extracción RAW)
     # --------------------------------------------------------
@@ -802,47 +818,49 @@ class NoRootExtractor:
         """
         self.log("\n===== MODO NO-ROOT EXTENDIDO (Android <= 14, sin root) =====\n")
 
-        # Core providers (contactos, llamadas, SMS, calendario)
-        self.extract_core_providers(opt)
-
+        # Volcados de texto independientes (providers, dumpsys, settings,
+        # logcat...): cada uno escribe archivos distintos, así que se solapan
+        # en un pool en vez de esperar un adb shell tras otro.
+        tasks = [
+            # Core providers (contactos, llamadas, SMS, calendario)
+            lambda: self.extract_core_providers(opt),
+            # Sistema / cuentas / settings
+            lambda: self.extract_users_accounts_settings(opt),
+            # Procesos / servicios en ejecución
+            lambda: self.extract_running_state(opt),
+            # Uso, batería y red (apps más utilizadas)
+            lambda: self.extract_usage_battery_network(opt),
+            # Notificaciones
+            lambda: self.extract_notifications(opt),
+            # Logs
+            lambda: self.extract_logs(opt),
+        ]
         # Historiales / descargas / navegador
         if opt.downloads_list:
-            self.extract_downloads_list()
+            tasks.append(self.extract_downloads_list)
         if opt.chrome_provider:
-            self.extract_chrome_provider()
+            tasks.append(self.extract_chrome_provider)
         if opt.browser_provider:
-            self.extract_browser_provider()
-
+            tasks.append(self.extract_browser_provider)
         # GPS / red
         if opt.gps_dumpsys:
-            self.extract_gps_dumpsys()
+            tasks.append(self.extract_gps_dumpsys)
         if opt.wifi_dumpsys:
-            self.extract_wifi_dumpsys()
+            tasks.append(self.extract_wifi_dumpsys)
         if opt.net_basic:
-            self.extract_net_basic()
+            tasks.append(self.extract_net_basic)
         if opt.net_connectivity:
-            self.extract_net_connectivity()
-
-        # Paquetes / APKs
+            tasks.append(self.extract_net_connectivity)
+        # Paquetes
         if opt.package_meta:
-            self.extract_package_meta()
+            tasks.append(self.extract_package_meta)
+        self._run_parallel(tasks)
+
+        # APKs (transferencias grandes, una a una)
         if opt.apks:
             self.extract_apks()
 
-        # Sistema / cuentas / settings
-        self.extract_users_accounts_settings(opt)
-
-        # Procesos / servicios en ejecución
-        self.extract_running_state(opt)
-
-        # Uso, batería y red (apps más utilizadas)
-        self.extract_usage_battery_network(opt)
-
-        # Notificaciones
-        self.extract_notifications(opt)
-
-        # Logs y bugreport
-        self.extract_logs(opt)
+        # Bugreport
         self.extract_bugreport(opt)
 
         # Backups lógicos
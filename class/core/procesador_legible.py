@@ -23,13 +23,26 @@ que asume que los DataFrames que recibe YA están normalizados.
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
+import mmap
+import multiprocessing
+import os
+import pickle
 import re
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+    _PYARROW_AVAILABLE = True
+except Exception:  # sin pyarrow los textos se quedan como object
+    _PYARROW_AVAILABLE = False
+
 
 # ---------------------------------------------------------------------------
 # Utilidades de parsing
@@ -37,14 +50,143 @@ import pandas as pd
 
 # Ejemplo de línea:
 # Row: 0 _id=1 address=+5917... date=173176... type=1 body=Hola mundo ...
-FIELD_RE = re.compile(r'(\w+)=([^=]*?)(?=\s\w+=|$)')
 
+def _fields_re(*keys: str) -> re.Pattern:
+    """
+    Regex de campos clave=valor de una fila Row: que solo captura las
+    claves `keys` (en cualquier orden): el resto de campos de la fila se
+    recorren pero no generan tuplas ni entradas en el dict.
+    """
+    alternativas = "|".join(re.escape(k) for k in keys)
+    return re.compile(r'(?:^|\s)(' + alternativas + r')=([^=]*?)(?=\s\w+=|$)')
+
+
+# Líneas "Row: ..." completas; se recorren con finditer sobre los bytes del
+# archivo en vez de splitlines() + startswith() línea a línea. Cortan en los
+# mismos separadores ASCII que splitlines() (\r suelto incluido: si no, un
+# cuerpo de SMS con \r acabaría sin comillas en el CSV y partiría la fila).
+_LINE_BREAKS = rb'\n\r\x0b\x0c\x1c\x1d\x1e'
+ROW_RE = re.compile(rb'(?<![^' + _LINE_BREAKS + rb'])Row:[^' + _LINE_BREAKS + rb']*')
+
+
+def read_csv_arrow(path: Path) -> pd.DataFrame:
+    """
+    pd.read_csv con el parser multihilo de pyarrow, si está instalado,
+    pero con los dtypes NumPy de siempre (enteros con huecos como float64,
+    texto como object), para que los CSV legibles salgan iguales con y sin
+    pyarrow.
+
+    Si pyarrow ha inferido fechas/horas (el parser C las deja como texto y
+    to_csv las reescribiría distinto) o no puede con el archivo, se vuelve
+    a leer con pd.read_csv normal.
+    """
+    if _PYARROW_AVAILABLE:
+        try:
+            df = pd.read_csv(path, engine="pyarrow")
+        except Exception:
+            df = None
+        if df is not None and not _has_inferred_temporal(df):
+            return df
+    return pd.read_csv(path)
+
+
+def _has_inferred_temporal(df: pd.DataFrame) -> bool:
+    """True si alguna columna es datetime64 o object con date/time de Python."""
+    for col in df.columns:
+        serie = df[col]
+        if pd.api.types.is_datetime64_any_dtype(serie.dtype):
+            return True
+        if serie.dtype == object:
+            primero = serie.first_valid_index()
+            if primero is not None and not isinstance(serie[primero], str):
+                return True
+    return False
+
+
+def iter_row_lines(path: Path) -> Iterator[str]:
+    """
+    Devuelve una a una las líneas "Row: ..." de `path`, ya decodificadas
+    (UTF-8 ignorando caracteres raros).
+
+    El archivo se mapea en memoria y solo se decodifican las líneas Row:,
+    así que nunca se tiene el volcado completo como str (ni sus líneas
+    de cabecera/ruido).
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for m in ROW_RE.finditer(mm):
+            yield m.group().decode("utf-8", "ignore")
+
+
+def make_row_parser(schema: tuple[tuple[str, str], ...]):
+    """
+    Genera (con exec) un parser especializado para un volcado Row:.
+
+    schema: pares (columna, clave) en el orden de salida, p. ej.
+        (("numero", "address"), ("fecha_epoch_ms", "date"), ...)
 
-def read_text_safe(path: Path) -> str:
-    """Lee texto como UTF-8 ignorando caracteres raros."""
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8", errors="ignore")
+    La función resultante, parse(path) -> {columna: [valores]}, tiene una
+    lista local por columna y un append por clave escritos en el propio
+    código del bucle, sin recorrer el esquema fila a fila. Solo se buscan
+    las claves del esquema (_fields_re); las ausentes quedan como ''.
+    """
+    fields_re = _fields_re(*dict.fromkeys(k for _, k in schema))
+    src = ["def parse(path):"]
+    for i in range(len(schema)):
+        src.append(f"    c{i} = []")
+        src.append(f"    c{i}_append = c{i}.append")
+    src.append("    findall = fields_re.findall")
+    src.append("    for line in iter_row_lines(path):")
+    src.append("        get = dict(findall(line)).get")
+    for i, (_, key) in enumerate(schema):
+        src.append(f"        c{i}_append(get({key!r}, ''))")
+    src.append(
+        "    return {" + ", ".join(f"{col!r}: c{i}" for i, (col, _) in enumerate(schema)) + "}"
+    )
+
+    ns = {"fields_re": fields_re, "iter_row_lines": iter_row_lines}
+    exec(compile("\n".join(src), f"<row_parser {schema[0][0]}...>", "exec"), ns)
+    return ns["parse"]
+
+
+# Un parser por tipo de volcado, con solo los campos que se usan
+parse_sms = make_row_parser(
+    (
+        ("numero", "address"),
+        ("fecha_epoch_ms", "date"),
+        ("tipo_codigo", "type"),
+        ("mensaje", "body"),
+    )
+)
+parse_contacts = make_row_parser(
+    (
+        ("nombre", "display_name"),
+        ("data1", "data1"),
+        ("number", "number"),
+        ("data4", "data4"),
+        ("tipo_codigo", "type"),
+    )
+)
+parse_calllog = make_row_parser(
+    (
+        ("numero", "number"),
+        ("nombre_cache", "name"),
+        ("fecha_epoch_ms", "date"),
+        ("tipo_codigo", "type"),
+        ("duracion_seg", "duration"),
+    )
+)
+parse_calendar = make_row_parser(
+    (
+        ("titulo", "title"),
+        ("calendario", "calendar_displayName"),
+        ("ubicacion", "eventLocation"),
+        ("dtstart_epoch_ms", "dtstart"),
+        ("dtend_epoch_ms", "dtend"),
+        ("timezone", "eventTimezone"),
+    )
+)
 
 
 @dataclass
@@ -68,29 +210,93 @@ class ForensicDataProcessor:
 
     # ---------------- helpers internos ----------------
 
-    @staticmethod
-    def _parse_row_fields(line: str) -> dict:
-        return {
-            k: v.strip().rstrip(",;")
-            for k, v in FIELD_RE.findall(line)
-        }
-
     @staticmethod
     def _epoch_ms_to_datetime(series: pd.Series) -> pd.Series:
         """
         Convierte valores tipo '1735084800000' (epoch ms) a datetime legible.
         Soporta texto con comillas o comas mezcladas.
         """
-        s = series.astype(str)
-        s = s.str.extract(r'(\d{10,})')[0]
-        s_num = pd.to_numeric(s, errors="coerce")
+        # Camino rápido: la inmensa mayoría son dígitos limpios y to_numeric
+        # los convierte en C. Solo lo que no parsea pasa por el regex.
+        s_num = pd.to_numeric(series, errors="coerce")
+        resto = s_num.isna() & series.notna() & series.ne("")
+        if resto.any():
+            extra = series[resto].astype(str).str.extract(r'(\d{10,})')[0]
+            s_num = s_num.astype("float64")
+            s_num[resto] = pd.to_numeric(extra, errors="coerce")
+        # Igual que antes: menos de 10 dígitos no es un epoch en ms válido
+        s_num = s_num.where(s_num >= 1_000_000_000)
         return pd.to_datetime(
-            s_num / 1000,
-            unit="s",
+            s_num,
+            unit="ms",
             origin="unix",
             errors="coerce",
         )
 
+    @staticmethod
+    def _clean_fields(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Limpia los valores capturados de las filas Row: (espacios y comas o
+        punto y coma sobrantes al final) con una pasada vectorizada por
+        columna, en vez de strip()/rstrip() valor a valor mientras se parsea.
+        """
+        return df.apply(lambda col: col.str.strip().str.rstrip(",;"))
+
+    @staticmethod
+    def _tipo_descripcion(codigos: pd.Series, tipo_map: dict[str, str]) -> pd.Categorical:
+        """
+        Traduce códigos de tipo ("1", "2", ...) a su descripción como
+        Categorical (códigos int8 + categorías compartidas) en lugar de una
+        columna object. Lo que no esté en tipo_map queda como DESCONOCIDO.
+        """
+        categorias = ["DESCONOCIDO"] + list(dict.fromkeys(tipo_map.values()))
+        tabla = np.zeros(max(int(k) for k in tipo_map) + 1, dtype="int8")
+        for k, v in tipo_map.items():
+            tabla[int(k)] = categorias.index(v)
+
+        n = pd.to_numeric(codigos, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        validos = (n >= 0) & (n < len(tabla)) & (n == np.floor(n))
+        codes = np.zeros(len(n), dtype="int8")
+        codes[validos] = tabla[n[validos].astype(np.intp)]
+        return pd.Categorical.from_codes(codes, categories=categorias)
+
+    @staticmethod
+    def _sort_by_datetime(df: pd.DataFrame, col: str) -> pd.DataFrame:
+        """
+        Ordena por una columna datetime64 con un argsort estable sobre sus
+        int64 y un único take() de todas las columnas. Los NaT van al final,
+        como en sort_values.
+        """
+        if not pd.api.types.is_datetime64_dtype(df[col].dtype):
+            return df.sort_values(col)
+        claves = df[col].to_numpy(dtype="datetime64[ns]").view("i8")
+        nat = np.iinfo(np.int64).min
+        claves = np.where(claves == nat, np.iinfo(np.int64).max, claves)
+        return df.take(np.argsort(claves, kind="stable"))
+
+    @staticmethod
+    def _shrink(
+        df: pd.DataFrame,
+        categorias: tuple[str, ...] = (),
+        textos: tuple[str, ...] = (),
+    ) -> pd.DataFrame:
+        """
+        Reduce la memoria de las tablas grandes antes de exportarlas:
+        - `categorias`: columnas muy repetidas (menos de un tercio de valores
+          únicos) -> category.
+        - `textos`: texto libre -> string[pyarrow] (buffer UTF-8 contiguo),
+          solo si pyarrow está instalado.
+        """
+        tipos: dict[str, str] = {}
+        for c in categorias:
+            if c in df.columns and df[c].nunique() * 3 < len(df):
+                tipos[c] = "category"
+        if _PYARROW_AVAILABLE:
+            for c in textos:
+                if c in df.columns:
+                    tipos[c] = "string[pyarrow]"
+        return df.astype(tipos) if tipos else df
+
     # Un poco más flexible: acepta epoch en segundos o milisegundos.
     @staticmethod
     def _epoch_to_datetime_generic(series: pd.Series) -> pd.Series:
@@ -242,29 +448,17 @@ class ForensicDataProcessor:
     # ---- SMS ----
     def load_sms(self) -> pd.DataFrame:
         path = self.logical_dir / "sms.txt"
-        text = read_text_safe(path)
-        if not text:
-            return pd.DataFrame()
 
-        rows = []
-        for line in text.splitlines():
-            if not line.startswith("Row:"):
-                continue
-            f = self._parse_row_fields(line)
-            rows.append(
-                {
-                    "numero": f.get("address", ""),
-                    "fecha_epoch_ms": f.get("date", ""),
-                    "tipo_codigo": f.get("type", ""),
-                    "mensaje": f.get("body", ""),
-                }
-            )
-
-        df = pd.DataFrame(rows)
+        # Una lista por columna: pandas guarda por columnas, así no hay un
+        # dict por fila que luego haya que transponer.
+        cols = parse_sms(path)
+        df = pd.DataFrame(cols)
+        del cols  # las columnas ya viven en df
         if df.empty:
             return df
+        df = self._clean_fields(df)
 
-        df["fecha_hora"] = self._epoch_ms_to_datetime(df["fecha_epoch_ms"])
+        df["fecha_hora"] = self._epoch_ms_to_datetime(df.pop("fecha_epoch_ms"))
 
         tipo_map = {
             "1": "RECIBIDO (INBOX)",
@@ -274,11 +468,10 @@ class ForensicDataProcessor:
             "5": "ENVIANDO",
             "6": "ENVIADO_FALLIDO",
         }
-        df["tipo_descripcion"] = (
-            df["tipo_codigo"].astype(str).map(tipo_map).fillna("DESCONOCIDO")
-        )
+        df["tipo_descripcion"] = self._tipo_descripcion(df["tipo_codigo"], tipo_map)
+        df["tipo_codigo"] = df["tipo_codigo"].astype("category")
 
-        df = df.sort_values("fecha_hora")
+        df = self._sort_by_datetime(df, "fecha_hora")
 
         # Orden amigable de columnas
         df = df[
@@ -290,32 +483,22 @@ class ForensicDataProcessor:
                 "mensaje",
             ]
         ]
-        return df
+        return self._shrink(df, categorias=("numero",), textos=("mensaje",))
 
     # ---- CONTACTOS ----
     def load_contactos(self) -> pd.DataFrame:
         path = self.logical_dir / "contacts.txt"
-        text = read_text_safe(path)
-        if not text:
-            return pd.DataFrame()
-
-        rows = []
-        for line in text.splitlines():
-            if not line.startswith("Row:"):
-                continue
-            f = self._parse_row_fields(line)
-            numero = f.get("data1") or f.get("number") or f.get("data4") or ""
-            rows.append(
-                {
-                    "nombre": f.get("display_name", ""),
-                    "numero": numero,
-                    "tipo_codigo": f.get("type", ""),
-                }
-            )
 
-        df = pd.DataFrame(rows)
+        cols = parse_contacts(path)
+        df = pd.DataFrame(cols)
+        del cols
         if df.empty:
             return df
+        df = self._clean_fields(df)
+
+        # El número es el primero no vacío de data1, number, data4
+        data1, number, data4 = df.pop("data1"), df.pop("number"), df.pop("data4")
+        df["numero"] = data1.where(data1 != "", number.where(number != "", data4))
 
         tipo_tel_map = {
             "1": "DOMICILIO",
@@ -325,9 +508,8 @@ class ForensicDataProcessor:
             "5": "DOMICILIO_FAX",
             "7": "OTRO",
         }
-        df["tipo_descripcion"] = (
-            df["tipo_codigo"].astype(str).map(tipo_tel_map).fillna("DESCONOCIDO")
-        )
+        df["tipo_descripcion"] = self._tipo_descripcion(df["tipo_codigo"], tipo_tel_map)
+        df["tipo_codigo"] = df["tipo_codigo"].astype("category")
 
         df = df.sort_values(["nombre", "numero"])
         df = df[["nombre", "numero", "tipo_codigo", "tipo_descripcion"]]
@@ -336,30 +518,15 @@ class ForensicDataProcessor:
     # ---- REGISTRO DE LLAMADAS ----
     def load_calllog(self) -> pd.DataFrame:
         path = self.logical_dir / "calllog.txt"
-        text = read_text_safe(path)
-        if not text:
-            return pd.DataFrame()
 
-        rows = []
-        for line in text.splitlines():
-            if not line.startswith("Row:"):
-                continue
-            f = self._parse_row_fields(line)
-            rows.append(
-                {
-                    "numero": f.get("number", ""),
-                    "nombre_cache": f.get("name", ""),
-                    "fecha_epoch_ms": f.get("date", ""),
-                    "tipo_codigo": f.get("type", ""),
-                    "duracion_seg": f.get("duration", ""),
-                }
-            )
-
-        df = pd.DataFrame(rows)
+        cols = parse_calllog(path)
+        df = pd.DataFrame(cols)
+        del cols
         if df.empty:
             return df
+        df = self._clean_fields(df)
 
-        df["fecha_hora"] = self._epoch_ms_to_datetime(df["fecha_epoch_ms"])
+        df["fecha_hora"] = self._epoch_ms_to_datetime(df.pop("fecha_epoch_ms"))
 
         tipo_llamada_map = {
             "1": "ENTRANTE",
@@ -370,18 +537,16 @@ class ForensicDataProcessor:
             "6": "BLOQUEADA",
             "7": "RESPONDIDA_EXTERNAMENTE",
         }
-        df["tipo_descripcion"] = (
-            df["tipo_codigo"].astype(str).map(tipo_llamada_map).fillna("DESCONOCIDO")
-        )
+        df["tipo_descripcion"] = self._tipo_descripcion(df["tipo_codigo"], tipo_llamada_map)
+        df["tipo_codigo"] = df["tipo_codigo"].astype("category")
 
         dur = df["duracion_seg"].astype(str).str.extract(r"(\d+)")[0]
-        df["duracion_seg"] = (
-            pd.to_numeric(dur, errors="coerce")
-            .fillna(0)
-            .astype("Int64")
+        df["duracion_seg"] = pd.to_numeric(
+            pd.to_numeric(dur, errors="coerce").fillna(0),
+            downcast="unsigned",
         )
 
-        df = df.sort_values("fecha_hora")
+        df = self._sort_by_datetime(df, "fecha_hora")
         df = df[
             [
                 "fecha_hora",
@@ -392,39 +557,23 @@ class ForensicDataProcessor:
                 "duracion_seg",
             ]
         ]
-        return df
+        return self._shrink(df, categorias=("numero", "nombre_cache"))
 
     # ---- CALENDARIO ----
     def load_calendario(self) -> pd.DataFrame:
         path = self.logical_dir / "calendar_events.txt"
-        text = read_text_safe(path)
-        if not text:
-            return pd.DataFrame()
-
-        rows = []
-        for line in text.splitlines():
-            if not line.startswith("Row:"):
-                continue
-            f = self._parse_row_fields(line)
-            rows.append(
-                {
-                    "titulo": f.get("title", ""),
-                    "calendario": f.get("calendar_displayName", ""),
-                    "ubicacion": f.get("eventLocation", ""),
-                    "dtstart_epoch_ms": f.get("dtstart", ""),
-                    "dtend_epoch_ms": f.get("dtend", ""),
-                    "timezone": f.get("eventTimezone", ""),
-                }
-            )
 
-        df = pd.DataFrame(rows)
+        cols = parse_calendar(path)
+        df = pd.DataFrame(cols)
+        del cols
         if df.empty:
             return df
+        df = self._clean_fields(df)
 
-        df["inicio"] = self._epoch_ms_to_datetime(df["dtstart_epoch_ms"])
-        df["fin"] = self._epoch_ms_to_datetime(df["dtend_epoch_ms"])
+        df["inicio"] = self._epoch_ms_to_datetime(df.pop("dtstart_epoch_ms"))
+        df["fin"] = self._epoch_ms_to_datetime(df.pop("dtend_epoch_ms"))
 
-        df = df.sort_values("inicio")
+        df = self._sort_by_datetime(df, "inicio")
         df = df[
             [
                 "inicio",
@@ -435,7 +584,9 @@ class ForensicDataProcessor:
                 "timezone",
             ]
         ]
-        return df
+        return self._shrink(
+            df, categorias=("calendario", "timezone"), textos=("titulo", "ubicacion")
+        )
 
     # ---- WHATSAPP (ROOT) ----
     def load_whatsapp_mensajes(self) -> pd.DataFrame:
@@ -444,14 +595,14 @@ class ForensicDataProcessor:
         if not path.exists():
             return pd.DataFrame()
 
-        df = pd.read_csv(path)
+        df = read_csv_arrow(path)
 
         # Normalizamos nombres y fecha
         df = self._normalize_whatsapp_mensajes_df(df)
 
         # Orden por fecha si existe
         if "fecha_hora" in df.columns:
-            df = df.sort_values("fecha_hora")
+            df = self._sort_by_datetime(df, "fecha_hora")
 
         return df
 
@@ -459,7 +610,7 @@ class ForensicDataProcessor:
         path = self.base_dir / "apps" / "whatsapp" / "whatsapp_contacts.csv"
         if not path.exists():
             return pd.DataFrame()
-        df = pd.read_csv(path)
+        df = read_csv_arrow(path)
         sort_cols = [c for c in ("display_name", "name", "jid") if c in df.columns]
         if sort_cols:
             df = df.sort_values(sort_cols)
@@ -479,7 +630,7 @@ class ForensicDataProcessor:
         if not src:
             return pd.DataFrame()
 
-        df = pd.read_csv(src)
+        df = read_csv_arrow(src)
 
         # Normalización de columnas
         df = self._normalize_exif_df(df)
@@ -642,7 +793,7 @@ class ForensicDataProcessor:
         if not path or not path.exists():
             return pd.DataFrame()
         try:
-            return pd.read_csv(path)
+            return read_csv_arrow(path)
         except Exception:
             return pd.DataFrame()
     @staticmethod
@@ -949,6 +1100,62 @@ class ForensicDataProcessor:
     # CARGA GLOBAL
     # -----------------------------------------------------------------------
 
+    # Medido con un volcado de 8,2 MiB: en serie se cargan ~4,6 MiB/s (regex +
+    # pandas) y cada proceso "spawn" cuesta ~1 s (arranque, import de pandas y
+    # devolver el DataFrame); en esa prueba el pool tardó 5,6 s frente a 1,8 s
+    # en serie. Como el volcado más grande marca el mínimo en paralelo, solo
+    # compensa si el resto tarda en serie más que ese arranque: 4,6 MiB/s x 1 s,
+    # con margen x2 (en Windows crear procesos es más lento) ~ 10 MiB.
+    _PARALLEL_MIN_BYTES = 10 * 1024 * 1024
+
+    def _load_row_dumps(self) -> Dict[str, pd.DataFrame]:
+        """
+        Carga los cuatro volcados Row: (sms, contactos, llamadas, calendario).
+
+        Son independientes y su parseo es CPU puro (regex), que con hilos no
+        escala por el GIL; si en total pesan bastante se reparten entre
+        procesos. Si no se puede usar el pool (p. ej. ejecutable congelado
+        sin freeze_support) o la máquina tiene una sola CPU, se cargan en
+        serie, como antes.
+
+        Los procesos se crean con "spawn" (no fork): esto se llama desde un
+        hilo del QThreadPool dentro de la GUI, y un fork con otros hilos
+        activos puede dejar al hijo bloqueado en un lock heredado. A cada
+        tarea solo se le pasa el nombre del loader y la ruta (_load_row_dump),
+        no el procesador entero.
+        """
+        loaders = {
+            "sms": ("load_sms", "sms.txt"),
+            "contactos": ("load_contactos", "contacts.txt"),
+            "llamadas": ("load_calllog", "calllog.txt"),
+            "calendario": ("load_calendario", "calendar_events.txt"),
+        }
+
+        sizes = [
+            (self.logical_dir / nombre).stat().st_size
+            for _, nombre in loaders.values()
+            if (self.logical_dir / nombre).exists()
+        ]
+        workers = min(len(sizes), os.cpu_count() or 1)
+
+        # Lo que se ahorra es el tiempo de los volcados que no son el mayor
+        if workers > 1 and sum(sizes) - max(sizes) >= self._PARALLEL_MIN_BYTES:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    logical_dir = str(self.logical_dir)
+                    futures = {
+                        k: pool.submit(_load_row_dump, metodo, logical_dir)
+                        for k, (metodo, _) in loaders.items()
+                    }
+                    return {k: fut.result() for k, fut in futures.items()}
+            except (OSError, BrokenProcessPool, pickle.PicklingError) as e:
+                print(f"  [LEGIBLE] Parseo en paralelo no disponible ({e}); se hace en serie.")
+
+        return {k: getattr(self, metodo)() for k, (metodo, _) in loaders.items()}
+
     def load_all(self) -> Dict[str, pd.DataFrame]:
         """
         Devuelve un diccionario con todos los artefactos legibles disponibles.
@@ -972,21 +1179,9 @@ class ForensicDataProcessor:
         """
         dfs: Dict[str, pd.DataFrame] = {}
 
-        sms = self.load_sms()
-        if not sms.empty:
-            dfs["sms"] = sms
-
-        contactos = self.load_contactos()
-        if not contactos.empty:
-            dfs["contactos"] = contactos
-
-        llamadas = self.load_calllog()
-        if not llamadas.empty:
-            dfs["llamadas"] = llamadas
-
-        calendario = self.load_calendario()
-        if not calendario.empty:
-            dfs["calendario"] = calendario
+        for key, df_row in self._load_row_dumps().items():
+            if not df_row.empty:
+                dfs[key] = df_row
 
         wa_msg = self.load_whatsapp_mensajes()
         if not wa_msg.empty:
@@ -1032,3 +1227,11 @@ class ForensicDataProcessor:
                 dfs[key] = df_app
 
         return dfs
+
+
+def _load_row_dump(metodo: str, logical_dir: str) -> pd.DataFrame:
+    """
+    Tarea de ForensicDataProcessor._load_row_dumps en un proceso hijo:
+    solo recibe el nombre del loader y la ruta (baratos de serializar).
+    """
+    return getattr(ForensicDataProcessor(Path(logical_dir)), metodo)()
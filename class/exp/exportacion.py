@@ -27,23 +27,44 @@ pequeños resúmenes (agrupaciones) como parte de los reportes.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import io
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 from dataclasses import dataclass, field
+from itertools import islice
 
+import numpy as np
 import pandas as pd
 
+try:
+    import fcntl  # solo POSIX, para el reflink (FICLONE)
+except ImportError:
+    fcntl = None
+
 try:
     from openpyxl.utils import get_column_letter
 except Exception:  # si no hay openpyxl, igual funcionará sin auto-width
     get_column_letter = None
 
+try:
+    import xlsxwriter  # noqa: F401
+    _XLSX_ENGINE = "xlsxwriter"
+except Exception:  # openpyxl como respaldo (con lxml instalado guarda más rápido)
+    _XLSX_ENGINE = "openpyxl"
+
+_XLSX_MAX_ROWS, _XLSX_MAX_COLS = 1_048_576, 16_384  # límites de una hoja Excel
+
 try:
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import A4
     from reportlab.platypus import (
         SimpleDocTemplate,
-        Table,
+        LongTable,
         TableStyle,
         Paragraph,
         Spacer,
@@ -54,6 +75,16 @@ try:
 except Exception:
     _REPORTLAB_AVAILABLE = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    _PYARROW_AVAILABLE = True
+except Exception:  # sin pyarrow: sin parquet y lectura de CSV con pandas
+    _PYARROW_AVAILABLE = False
+
+_WRITE_BUFSIZE = 1 << 20  # buffer de escritura de CSV/XLSX/PDF (1 MiB, no 8 KiB)
+
 
 # ---------------------------------------------------------------------------
 # Meta de artefactos: nombre de hoja y descripción
@@ -144,30 +175,149 @@ def get_artifact_meta(key: str) -> tuple[str, str]:
 # Utils internos
 # ---------------------------------------------------------------------------
 
-def _read_text_safe(path: Path) -> str:
-    if not path.exists():
-        return ""
-    return path.read_text(encoding="utf-8", errors="ignore")
+_COPY_BUFSIZE = 1024 * 1024  # 1 MiB por lectura
+_COPY_MMAP_MIN = 16 * 1024 * 1024  # desde aquí se copia mapeando el origen
+_FICLONE = 0x40049409  # ioctl de Linux para reflink (Btrfs/XFS)
 
 
-def _copy_file(src: Path, dst: Path) -> None:
-    if not src.exists():
-        return
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copia `size` bytes de src_fd a dst_fd dentro del kernel, sin pasar los
+    datos por Python: primero reflink (FICLONE, copia CoW instantánea) y si
+    no, os.copy_file_range. Devuelve False si el sistema no soporta
+    ninguno; en ese caso dst_fd queda vacío y en la posición 0.
+    """
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return True
+        except OSError:
+            pass
+
+    if hasattr(os, "copy_file_range"):
+        copied = 0
+        try:
+            while copied < size:
+                n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if not n:
+                    break
+                copied += n
+        except OSError:
+            copied = -1
+        if copied == size:
+            return True
+
+    os.lseek(src_fd, 0, os.SEEK_SET)
+    os.lseek(dst_fd, 0, os.SEEK_SET)
+    os.ftruncate(dst_fd, 0)
+    return False
+
+
+def _copy_file(src: Path, dst: Path) -> Optional[str]:
+    """
+    Copia src -> dst byte a byte (sin decodificar ni recodificar), de modo
+    que la copia RAW es idéntica al original (cadena de custodia).
+
+    El SHA-256 se calcula en la misma pasada de lectura, reutilizando un
+    único buffer. Los archivos grandes (>= _COPY_MMAP_MIN, p. ej. el
+    bugreport.zip) se copian dentro del kernel (_kernel_copy) y solo se
+    hashean desde un mapeo en memoria del origen; si el sistema no lo
+    permite se escriben desde las páginas del mapeo, sin buffer intermedio.
+    Devuelve el hash en hex, o None si src no existe.
+    """
+    try:
+        fsrc = open(src, "rb")
+    except FileNotFoundError:
+        return None
     dst.parent.mkdir(parents=True, exist_ok=True)
-    # texto plano para preservar legibilidad en cualquier editor
-    dst.write_text(_read_text_safe(src), encoding="utf-8")
-    print(f"  [RAW] Copiado {src} -> {dst}")
+
+    digest = hashlib.sha256()
+    with fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        if size >= _COPY_MMAP_MIN:
+            with mmap.mmap(fsrc.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _kernel_copy(fsrc.fileno(), fdst.fileno(), size):
+                    digest.update(mm)
+                else:
+                    view = memoryview(mm)
+                    try:
+                        for off in range(0, len(mm), _COPY_BUFSIZE):
+                            chunk = view[off:off + _COPY_BUFSIZE]
+                            digest.update(chunk)
+                            fdst.write(chunk)
+                    finally:
+                        chunk = None
+                        view.release()
+        else:
+            buf = bytearray(_COPY_BUFSIZE)
+            view = memoryview(buf)
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                chunk = view[:n]
+                digest.update(chunk)
+                fdst.write(chunk)
+
+    sha256 = digest.hexdigest()
+    print(f"  [RAW] Copiado {src} -> {dst} (sha256={sha256})")
+    return sha256
+
+
+_COPY_WORKERS = 4  # copias RAW simultáneas
+
+
+def _copy_files_batch(pairs: Iterable[Tuple[Path, Path]]) -> Dict[Path, str]:
+    """
+    Copia varios pares (src, dst) en un pool de hilos, de modo que las
+    lecturas/escrituras de distintos artefactos se solapen en vez de
+    esperar una tras otra. La E/S y hashlib liberan el GIL.
+
+    Los orígenes deberían venir ya filtrados (_scan_files); si alguno
+    desaparece entre medias, _copy_file lo omite.
+    Devuelve {dst: sha256} de los archivos que se copiaron.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return {}
+
+    workers = min(_COPY_WORKERS, len(pairs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        hashes = list(pool.map(lambda p: _copy_file(*p), pairs))
+
+    return {dst: h for (_, dst), h in zip(pairs, hashes) if h is not None}
 
 
 # ---------------------------------------------------------------------------
 # 1) Copia de artefactos crudos (cadena de custodia)
 # ---------------------------------------------------------------------------
 
+RAW_MANIFEST = "sha256sums.txt"  # hashes de las copias de export/raw
+
+
+def _scan_files(directory: Path, names: Iterable[str]) -> Dict[str, Path]:
+    """
+    Lista `directory` una sola vez con os.scandir y devuelve {nombre: ruta}
+    de los archivos de `names` presentes. Sustituye un stat() por archivo
+    (caro en montajes SMB/NFS) por una única lectura del directorio.
+    """
+    wanted = set(names)
+    try:
+        with os.scandir(directory) as it:
+            return {
+                e.name: Path(e.path)
+                for e in it
+                if e.name in wanted and e.is_file()
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
 def copy_raw_files(
     logical_dir: Path,
     raw_dir: Path,
     extra_logical_files: Optional[Iterable[str]] = None,
-) -> None:
+) -> Dict[Path, str]:
     """
     Copia artefactos crudos relevantes a export/raw.
 
@@ -179,6 +329,9 @@ def copy_raw_files(
     Se buscan archivos en:
         logical_dir
         logical_dir.parent / "system"   (para dumpsys_location, dumpsys_wifi, etc.)
+
+    El SHA-256 de cada copia se guarda en raw_dir/RAW_MANIFEST (formato de
+    sha256sum, verificable con 'sha256sum -c') y se devuelve {dst: sha256}.
     """
     logical_dir = Path(logical_dir)
     raw_dir = Path(raw_dir)
@@ -208,95 +361,378 @@ def copy_raw_files(
         "bugreport.zip", 
     ]
 
-    # Desde logical/
-    for name in logical_names:
-        src = logical_dir / name
-        dst = raw_dir / name
-        if src.suffix.lower() == ".zip":
-            # zip → copiar binario
-            if src.exists():
-                dst.write_bytes(src.read_bytes())
-                print(f"  [RAW] Copiado binario {src} -> {dst}")
-        else:
-            _copy_file(src, dst)
-
-    # Desde system/
-    for name in system_names:
-        src = sys_dir / name
-        dst = raw_dir / name
-        if not src.exists():
-            continue
-        if src.suffix.lower() == ".zip":
-            dst.write_bytes(src.read_bytes())
-            print(f"  [RAW] Copiado binario {src} -> {dst}")
-        else:
-            _copy_file(src, dst)
+    # Desde logical/ y system/ (TXT y binarios se copian igual: byte a byte)
+    pairs = [
+        (src, raw_dir / name)
+        for name, src in _scan_files(logical_dir, logical_names).items()
+    ]
+    pairs += [
+        (src, raw_dir / name)
+        for name, src in _scan_files(sys_dir, system_names).items()
+    ]
+    hashes = _copy_files_batch(pairs)
+    if hashes:
+        manifest = raw_dir / RAW_MANIFEST
+        with open(manifest, "w", encoding="utf-8", newline="\n") as f:
+            for dst, sha256 in sorted(hashes.items(), key=lambda x: x[0].name):
+                f.write(f"{sha256}  {dst.name}\n")
+        print(f"  [RAW] Hashes SHA-256 guardados en {manifest}")
+    return hashes
 
 
 # ---------------------------------------------------------------------------
 # 2) Exportación a CSV legible
 # ---------------------------------------------------------------------------
 
-def _export_sms_csv(df: pd.DataFrame, legible_dir: Path) -> None:
+_UTF8_BOM = b"\xef\xbb\xbf"  # igual que encoding="utf-8-sig" (Excel lo necesita)
+
+
+_CSV_GZIP_LEVEL = 1  # nivel 1: ~5x más rápido que 9 por <10% más de tamaño
+
+
+def _csv_name(nombre: str, compress: bool) -> str:
+    return f"{nombre}.csv.gz" if compress else f"{nombre}.csv"
+
+
+def _open_csv_binary(path: Path, compress: bool):
+    """
+    Abre path para escritura binaria. Con compress=True devuelve un GzipFile
+    de nivel 1 con mtime=0, de modo que el mismo contenido produce siempre
+    el mismo .gz (y el mismo hash).
+    """
+    if not compress:
+        return open(path, "wb", buffering=_WRITE_BUFSIZE)
+    return gzip.GzipFile(path, mode="wb", compresslevel=_CSV_GZIP_LEVEL, mtime=0)
+
+
+_CSV_EOL = os.linesep  # mismo fin de línea que to_csv por defecto
+_FAST_CSV_CHUNK = 65536                 # filas por write() en el camino rápido
+_CSV_QUOTE_CHARS = (",", '"', "\n")  # obligan a entrecomillar el campo
+# '\r' suelto se entrecomilla o no según la versión del módulo csv: si
+# aparece, se deja la tabla a to_csv.
+_CSV_UNSAFE_CHARS = ("\r",)
+
+
+def _format_datetimes_csv(values: np.ndarray) -> list:
+    """
+    Formatea datetime64 igual que to_csv: solo fecha si todo cae a
+    medianoche y, si no, la precisión mínima (s/ms/us/ns) que no pierde
+    información. NaT -> ''.
+    """
+    values = values.astype("datetime64[ns]")
+    nat = np.isnat(values)
+    ns = values.view("i8")[~nat]
+    if not ns.size:
+        return [""] * len(values)
+
+    if not (ns % 86_400_000_000_000).any():
+        unit = "D"
+    elif not (ns % 1_000_000_000).any():
+        unit = "s"
+    elif not (ns % 1_000_000).any():
+        unit = "ms"
+    elif not (ns % 1_000).any():
+        unit = "us"
+    else:
+        unit = "ns"
+
+    txt = np.char.replace(np.datetime_as_string(values, unit=unit), "T", " ")
+    txt[nat] = ""
+    return txt.tolist()
+
+
+def _fast_csv_column(serie: pd.Series) -> Optional[list]:
+    """
+    Devuelve la columna como lista de str tal como la escribiría to_csv
+    ('' en nulos), o None si su dtype no tiene camino rápido
+    (float, category, tz-aware, object con tipos mezclados...).
+    """
+    dtype = serie.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return serie.to_numpy().astype(str).tolist()
+        if dtype.kind == "M":
+            return _format_datetimes_csv(serie.to_numpy())
+        if dtype == object and pd.api.types.infer_dtype(serie, skipna=True) in ("string", "empty"):
+            return serie.fillna("").tolist()
+        return None
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Cada categoría se formatea una sola vez y se reparte por sus códigos
+        cats = _fast_csv_column(pd.Series(dtype.categories))
+        if cats is None:
+            return None
+        lookup = np.array(cats + [""], dtype=object)  # código -1 (nulo) -> ''
+        return lookup[serie.cat.codes.to_numpy()].tolist()
+
+    if isinstance(dtype, pd.StringDtype):  # string / string[pyarrow]
+        return serie.to_numpy(dtype=object, na_value="").tolist()
+
+    if pd.api.types.is_integer_dtype(dtype):  # Int64 nullable
+        out = serie.to_numpy(dtype="int64", na_value=0).astype(str).tolist()
+        for i in np.flatnonzero(serie.isna().to_numpy()):
+            out[i] = ""
+        return out
+    return None
+
+
+def _quote_csv_values(values: list) -> Optional[list]:
+    """
+    Entrecomilla (QUOTE_MINIMAL, '"' duplicada) solo los valores que lo
+    necesitan, igual que el módulo csv. Devuelve la misma lista si ninguno
+    lo necesita, o None si hay caracteres sin salida garantizada.
+    """
+    joined = "\x00".join(values)
+    if any(ch in joined for ch in _CSV_UNSAFE_CHARS):
+        return None
+    if not any(ch in joined for ch in _CSV_QUOTE_CHARS):
+        return values
+    return [
+        '"' + v.replace('"', '""') + '"'
+        if ("," in v or '"' in v or "\n" in v) else v
+        for v in values
+    ]
+
+
+def _write_csv_fast(df: pd.DataFrame, path: Path, compress: bool = False) -> bool:
+    """
+    Camino rápido para tablas de solo texto/enteros/fechas (SMS, llamadas,
+    WhatsApp...): formatea cada columna de una vez y compone las filas con
+    str.join, sin pasar por el writer celda a celda de pandas. Los campos
+    con comas, comillas o saltos de línea (cuerpos de SMS) se entrecomillan
+    aquí mismo (_quote_csv_values).
+
+    Devuelve False (sin escribir nada) cuando no puede garantizar la misma
+    salida que to_csv.
+    """
+    if df.shape[1] < 2:  # el módulo csv entrecomilla filas de un solo campo vacío
+        return False
+
+    header = _quote_csv_values([str(c) for c in df.columns])
+    if header is None:
+        return False
+    cols = []
+    for i in range(df.shape[1]):
+        col = _fast_csv_column(df.iloc[:, i])
+        if col is not None:
+            col = _quote_csv_values(col)
+        if col is None:
+            return False
+        cols.append(col)
+
+    # newline="": los \n dentro de campos entrecomillados se escriben tal
+    # cual, como hace to_csv; solo el fin de fila es _CSV_EOL.
+    with io.TextIOWrapper(
+        _open_csv_binary(path, compress), encoding="utf-8-sig", newline=""
+    ) as f:
+        f.write(",".join(header) + _CSV_EOL)
+        rows = zip(*cols)
+        while True:
+            chunk = list(islice(rows, _FAST_CSV_CHUNK))
+            if not chunk:
+                break
+            f.write(_CSV_EOL.join(map(",".join, chunk)) + _CSV_EOL)
+    return True
+
+
+_DIRECT_IO_MIN = 32 * 1024 * 1024    # por debajo O_DIRECT no compensa
+_DIRECT_IO_CHUNK = 16 * 1024 * 1024  # bloques alineados para O_DIRECT
+
+
+def _write_bytes_direct(path: Path, view: memoryview) -> bool:
+    """
+    Escribe la parte alineada de `view` con O_DIRECT (sin pasar por la
+    caché de páginas, así un CSV enorme no expulsa páginas más útiles) en
+    bloques de 16 MiB copiados a un buffer anónimo alineado a página.
+    La cola no alineada se añade con una escritura normal.
+
+    Devuelve False si el sistema/FS no admite O_DIRECT (Windows, tmpfs...),
+    sin haber dejado nada escrito que importe.
+    """
+    alineado = len(view) - len(view) % _DIRECT_IO_CHUNK
+    if not alineado or not hasattr(os, "O_DIRECT"):
+        return False
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+    except OSError:
+        return False
+
+    ok = True
+    try:
+        with mmap.mmap(-1, _DIRECT_IO_CHUNK) as buf:
+            for off in range(0, alineado, _DIRECT_IO_CHUNK):
+                buf[:] = view[off:off + _DIRECT_IO_CHUNK]
+                if os.pwrite(fd, buf, off) != _DIRECT_IO_CHUNK:
+                    ok = False
+                    break
+    except OSError:
+        ok = False
+    finally:
+        os.close(fd)
+
+    if ok:
+        with open(path, "r+b") as f:
+            f.seek(alineado)
+            f.write(view[alineado:])
+    return ok
+
+
+def _write_bytes(path: Path, data) -> None:
+    """
+    Vuelca un buffer ya generado con una única escritura; los de más de
+    _DIRECT_IO_MIN se intentan escribir con O_DIRECT.
+    """
+    view = memoryview(data)
+    if len(view) >= _DIRECT_IO_MIN and _write_bytes_direct(path, view):
+        return
+    with open(path, "wb") as f:
+        f.write(view)  # BufferedWriter reintenta hasta escribirlo entero
+
+
+def _write_csv(df: pd.DataFrame, path: Path, compress: bool = False) -> None:
+    """
+    Escribe df como CSV UTF-8 con BOM, sin índice (gzip nivel 1 si compress).
+
+    Ambos caminos producen los mismos bytes:
+        1) _write_csv_fast, para tablas de texto/enteros/fechas.
+        2) DataFrame.to_csv (p. ej. columnas object con tipos mezclados).
+    """
+    if _write_csv_fast(df, path, compress):
+        return
+
+    if compress:
+        with _open_csv_binary(path, compress) as f:
+            f.write(_UTF8_BOM)
+            df.to_csv(f, index=False, encoding="utf-8")
+        return
+
+    # Se genera el CSV entero en memoria y se escribe de una vez
+    sink = io.BytesIO()
+    sink.write(_UTF8_BOM)
+    df.to_csv(sink, index=False, encoding="utf-8")
+    _write_bytes(path, sink.getbuffer())
+
+
+def _categoricalize(df: pd.DataFrame, cols: Iterable[str]) -> pd.DataFrame:
+    """
+    Devuelve df con las columnas `cols` muy repetidas (menos de un tercio de
+    valores únicos) pasadas a category, para formatear cada valor una sola
+    vez al escribir y agrupar por códigos. No modifica el df original.
+    """
+    nuevas = {}
+    for c in cols:
+        if c in df.columns and df[c].dtype == object and df[c].nunique() * 3 < len(df):
+            nuevas[c] = df[c].astype("category")
+    return df.assign(**nuevas) if nuevas else df
+
+
+def _export_sms_csv(
+    df: pd.DataFrame, legible_dir: Path, log: list[str], compress: bool = False
+) -> None:
     """
     CSV principal + resumen por número.
     Se asume que df viene normalizado desde procesador_legible:
     columnas: fecha_hora, numero, tipo_codigo, tipo_descripcion, mensaje
     """
-    legible_dir.mkdir(parents=True, exist_ok=True)
-    path_main = legible_dir / "sms_legible.csv"
-    df.to_csv(path_main, index=False, encoding="utf-8-sig")
-    print(f"  [CSV] {path_main.name}")
+    df = _categoricalize(df, ["numero", "tipo_codigo", "tipo_descripcion"])
+    path_main = legible_dir / _csv_name("sms_legible", compress)
+    _write_csv(df, path_main, compress)
+    log.append(f"  [CSV] {path_main.name}")
 
     if "numero" in df.columns:
+        # value_counts va directo a la tabla hash, sin el despachador de groupby
         resumen = (
-            df.groupby("numero", dropna=False)
-            .agg(total_mensajes=("mensaje", "count"))
-            .reset_index()
+            df["numero"]
+            .value_counts(dropna=False)
+            .rename_axis("numero")
+            .reset_index(name="total_mensajes")
         )
-        path_res = legible_dir / "sms_resumen_por_numero.csv"
-        resumen.to_csv(path_res, index=False, encoding="utf-8-sig")
-        print(f"  [CSV] {path_res.name}")
+        path_res = legible_dir / _csv_name("sms_resumen_por_numero", compress)
+        _write_csv(resumen, path_res, compress)
+        log.append(f"  [CSV] {path_res.name}")
 
 
-def _export_llamadas_csv(df: pd.DataFrame, legible_dir: Path) -> None:
+def _export_llamadas_csv(
+    df: pd.DataFrame, legible_dir: Path, log: list[str], compress: bool = False
+) -> None:
     """
     CSV principal + resumen por número.
     Se asume que df viene normalizado desde procesador_legible:
     columnas: fecha_hora, numero, nombre_cache, tipo_codigo, tipo_descripcion, duracion_seg
     """
-    legible_dir.mkdir(parents=True, exist_ok=True)
-    path_main = legible_dir / "llamadas_legible.csv"
-    df.to_csv(path_main, index=False, encoding="utf-8-sig")
-    print(f"  [CSV] {path_main.name}")
+    df = _categoricalize(df, ["numero", "nombre_cache", "tipo_codigo", "tipo_descripcion"])
+    path_main = legible_dir / _csv_name("llamadas_legible", compress)
+    _write_csv(df, path_main, compress)
+    log.append(f"  [CSV] {path_main.name}")
 
     if "numero" in df.columns:
-        agg_map = {
-            "total_llamadas": ("tipo_codigo", "count"),
-        }
+        # factorize + bincount: un recorrido por columna, sin groupby/agg/reset_index
+        codes, uniques = pd.factorize(df["numero"], sort=False, use_na_sentinel=False)
+        ngroups = len(uniques)
+
+        resumen = pd.DataFrame({"numero": uniques})
+        if "tipo_codigo" in df.columns:
+            resumen["total_llamadas"] = np.bincount(
+                codes, weights=df["tipo_codigo"].notna().to_numpy(), minlength=ngroups
+            ).astype("int64")
         if "duracion_seg" in df.columns:
-            agg_map["duracion_total_seg"] = ("duracion_seg", "sum")
+            dur = pd.to_numeric(df["duracion_seg"], errors="coerce")
+            total = np.bincount(
+                codes, weights=dur.to_numpy(dtype="float64", na_value=0.0), minlength=ngroups
+            )
+            if pd.api.types.is_integer_dtype(dur.dtype):
+                total = total.round().astype("int64")
+            resumen["duracion_total_seg"] = total
+        path_res = legible_dir / _csv_name("llamadas_resumen_por_numero", compress)
+        _write_csv(resumen, path_res, compress)
+        log.append(f"  [CSV] {path_res.name}")
 
-        resumen = (
-            df.groupby("numero", dropna=False)
-            .agg(**agg_map)
-            .reset_index()
-        )
-        path_res = legible_dir / "llamadas_resumen_por_numero.csv"
-        resumen.to_csv(path_res, index=False, encoding="utf-8-sig")
-        print(f"  [CSV] {path_res.name}")
 
+def _export_generico_csv(
+    nombre: str, df: pd.DataFrame, legible_dir: Path, log: list[str], compress: bool = False
+) -> None:
+    path = legible_dir / _csv_name(nombre, compress)
+    _write_csv(df, path, compress)
+    log.append(f"  [CSV] {path.name}")
 
-def _export_generico_csv(nombre: str, df: pd.DataFrame, legible_dir: Path) -> None:
-    legible_dir.mkdir(parents=True, exist_ok=True)
-    path = legible_dir / f"{nombre}.csv"
-    df.to_csv(path, index=False, encoding="utf-8-sig")
-    print(f"  [CSV] {path.name}")
 
+def _export_parquet(
+    nombre: str, df: pd.DataFrame, legible_dir: Path, log: list[str]
+) -> None:
+    """
+    Copia tipada y columnar (zstd) de la tabla principal, junto al CSV.
+    El CSV sigue siendo el formato de referencia para la cadena de custodia;
+    el Parquet es para análisis posterior (pandas/Polars/DuckDB) sin reparsear.
+    """
+    base = {"sms": "sms_legible", "llamadas": "llamadas_legible"}.get(nombre, nombre)
+    path = legible_dir / f"{base}.parquet"
+    try:
+        df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+    except (pa.ArrowException, ValueError) as e:
+        log.append(f"  [PARQUET] {path.name} no generado: {e}")
+        return
+    log.append(f"  [PARQUET] {path.name}")
+
+
+_CSV_WORKERS = 4  # artefactos exportados a CSV simultáneamente
 
-def export_csv_legible(dfs: DFMap, legible_dir: Path) -> None:
+
+def export_csv_legible(
+    dfs: DFMap,
+    legible_dir: Path,
+    compress: bool = False,
+    use_threads: bool = True,
+    parquet: bool = True,
+) -> None:
     """
     Exporta todos los artefactos disponibles en `dfs` a CSV legibles.
+    Con compress=True se generan .csv.gz (gzip nivel 1, deterministas).
+    Con parquet=True (y pyarrow instalado) cada tabla principal se guarda
+    además como .parquet (zstd).
+
+    Cada artefacto es independiente, así que con use_threads=True se
+    exportan en paralelo (la escritura y los groupby sueltan el GIL buena
+    parte del tiempo). use_threads=False los exporta uno tras otro.
 
     IMPORTANTE:
     - Se asume que `dfs` viene de ForensicDataProcessor.load_all()
@@ -307,27 +743,110 @@ def export_csv_legible(dfs: DFMap, legible_dir: Path) -> None:
     legible_dir = Path(legible_dir)
     legible_dir.mkdir(parents=True, exist_ok=True)
 
-    handled: set[str] = set()
-
-    if "sms" in dfs:
-        _export_sms_csv(dfs["sms"], legible_dir)
-        handled.add("sms")
-
-    if "llamadas" in dfs:
-        _export_llamadas_csv(dfs["llamadas"], legible_dir)
-        handled.add("llamadas")
+    # Los helpers no crean el directorio ni imprimen: acumulan sus líneas en
+    # `log` y se vuelcan de una vez al final.
+    log: list[str] = []
+    especificos = {
+        "sms": _export_sms_csv,
+        "llamadas": _export_llamadas_csv,
+    }
 
-    # El resto se exporta de forma genérica 1:1
+    tasks = []
     for nombre, df in sorted(dfs.items(), key=lambda x: x[0]):
-        if nombre in handled:
+        if df is None or df.empty:
+            # Sin filas no se crea archivo (ni cabecera, ni flush)
+            log.append(f"  [CSV] {nombre} vacío, se omite")
             continue
-        _export_generico_csv(nombre, df, legible_dir)
+        if nombre in especificos:
+            tasks.append((especificos[nombre], (df, legible_dir, log, compress)))
+        else:
+            # El resto se exporta de forma genérica 1:1
+            tasks.append((_export_generico_csv, (nombre, df, legible_dir, log, compress)))
+        if parquet and _PYARROW_AVAILABLE:
+            tasks.append((_export_parquet, (nombre, df, legible_dir, log)))
+
+    try:
+        if not use_threads or len(tasks) < 2:
+            for fn, args in tasks:
+                fn(*args)
+        else:
+            with ThreadPoolExecutor(max_workers=min(_CSV_WORKERS, len(tasks))) as pool:
+                futures = [pool.submit(fn, *args) for fn, args in tasks]
+                for fut in futures:
+                    fut.result()  # propaga la primera excepción, como en la versión secuencial
+    finally:
+        if log:
+            print("\n".join(log))
+
+
+# ---------------------------------------------------------------------------
+# Formateo de celdas a texto (PDF)
+# ---------------------------------------------------------------------------
+
+def _column_to_str(serie: pd.Series) -> list:
+    """
+    Convierte una columna completa a lista de str con una sola operación
+    según su dtype (en vez de formatear celda a celda). El texto es el
+    mismo que daría str(valor): floats con toda su precisión (coordenadas,
+    números de teléfono en columnas float por NaN) y fechas con su
+    resolución completa, sin redondear a segundos.
+    """
+    dtype = serie.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        return np.char.mod("%d", serie.to_numpy()).tolist()
+    if dtype == object:
+        return list(map(str, serie.to_numpy()))
+    # float, datetime64 y extension dtypes (Int64, category, tz-aware...)
+    return serie.astype(str).tolist()
+
+
+def _df_to_str_rows(df: pd.DataFrame) -> list[list[str]]:
+    """Filas de texto (sin cabecera) listas para una tabla de ReportLab."""
+    cols = [_column_to_str(df[c]) for c in df.columns]
+    return [list(row) for row in zip(*cols)]
 
 
 # ---------------------------------------------------------------------------
 # 3) Exportación a Excel (reporte multi-hoja)
 # ---------------------------------------------------------------------------
 
+def _open_excel_writer(handle, constant_memory: bool = False) -> pd.ExcelWriter:
+    """
+    ExcelWriter común a ForensicExcelReport y crear_resumen_excel.
+
+    Usa xlsxwriter si está disponible (escribe directo al .xlsx, sin
+    mantener un árbol de celdas en memoria como openpyxl). Los textos se
+    guardan literalmente: nada de URLs ni fórmulas implícitas a partir de
+    datos del dispositivo.
+
+    constant_memory=True vuelca cada fila a disco en cuanto se pasa a la
+    siguiente (RAM constante por hoja), pero exige escribir fila a fila en
+    orden: NO sirve con DataFrame.to_excel, que escribe por columnas.
+    Solo lo usa ForensicExcelReport a través de _write_sheet.
+    """
+    if _XLSX_ENGINE == "xlsxwriter":
+        options = {
+            "strings_to_urls": False,
+            "strings_to_formulas": False,
+            "nan_inf_to_errors": True,
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+        }
+        if constant_memory:
+            options["constant_memory"] = True
+        return pd.ExcelWriter(handle, engine="xlsxwriter", engine_kwargs={"options": options})
+    return pd.ExcelWriter(handle, engine="openpyxl")
+
+
+def _column_to_cells(serie: pd.Series) -> list:
+    """Columna -> valores Python para xlsxwriter (None en nulos = celda vacía)."""
+    if isinstance(serie.dtype, pd.DatetimeTZDtype):
+        serie = serie.dt.tz_localize(None)
+    out = serie.astype(object).tolist()
+    for i in np.flatnonzero(serie.isna().to_numpy()):
+        out[i] = None
+    return out
+
+
 @dataclass
 class ForensicExcelReport:
     """
@@ -366,38 +885,32 @@ class ForensicExcelReport:
         resumen_rows = []
 
         try:
-            with pd.ExcelWriter(self.excel_path, engine="openpyxl") as writer:
+            with open(self.excel_path, "wb", buffering=_WRITE_BUFSIZE) as fh, \
+                    _open_excel_writer(fh, constant_memory=True) as writer:
                 # 1) Hojas por artefacto
                 for key, df in sorted(self.dfs.items(), key=lambda x: x[0]):
                     sheet_name, desc = get_artifact_meta(key)
 
-                    # df_norm: usamos tal cual, solo garantizamos que no esté vacío
+                    # df_norm: usamos tal cual (to_excel no lo modifica),
+                    # solo garantizamos que no esté vacío
                     if df is None or df.empty:
                         df_norm = pd.DataFrame({"INFO": ["Sin registros."]})
                     else:
-                        df_norm = df.copy()
-
-                    startrow = 3  # filas 1-2 para descripción
-                    df_norm.to_excel(
-                        writer,
-                        sheet_name=sheet_name,
-                        index=False,
-                        startrow=startrow,
-                    )
-                    ws = writer.sheets[sheet_name]
+                        df_norm = df
 
                     # Descripción en la primera fila
                     descripcion = desc or f"Artefacto '{key}' extraído del dispositivo."
                     if self.case_name:
                         descripcion = f"Caso: {self.case_name} | {descripcion}"
-                    ws.cell(row=1, column=1, value=descripcion)
+
+                    startrow = 3  # filas 1-2 para descripción
+                    ws = self._write_sheet(writer, sheet_name, df_norm, startrow, descripcion)
 
                     # Congelar fila de cabeceras
-                    ws.freeze_panes = ws.cell(row=startrow + 1, column=1)
+                    self._freeze_rows(ws, startrow + 1)
 
                     # Auto-ancho de columnas
-                    if get_column_letter is not None:
-                        self._auto_width(ws, df_norm)
+                    self._auto_width(ws, df_norm)
 
                     # Info para hoja RESUMEN
                     resumen_rows.append(
@@ -413,35 +926,90 @@ class ForensicExcelReport:
                 # 2) Hoja RESUMEN
                 if resumen_rows:
                     df_resumen = pd.DataFrame(resumen_rows)
-                    df_resumen.to_excel(
-                        writer,
-                        sheet_name="RESUMEN",
-                        index=False,
-                    )
-                    ws_res = writer.sheets["RESUMEN"]
-                    ws_res.freeze_panes = ws_res.cell(row=2, column=1)
-                    if get_column_letter is not None:
-                        self._auto_width(ws_res, df_resumen)
+                    ws_res = self._write_sheet(writer, "RESUMEN", df_resumen, 0)
+                    self._freeze_rows(ws_res, 1)
+                    self._auto_width(ws_res, df_resumen)
 
             print(f"  [XLSX] Reporte forense avanzado exportado en {self.excel_path}")
         except Exception as e:
             print(f"  [!] No se pudo crear el Excel ({self.excel_path.name}): {e}")
             print("      Aun así, los CSV legibles ya pueden estar generados.")
 
+    # ----------------- Formato de hoja (xlsxwriter / openpyxl) -----------------
+
+    def _write_sheet(
+        self,
+        writer: pd.ExcelWriter,
+        sheet_name: str,
+        df: pd.DataFrame,
+        startrow: int,
+        title: Optional[str] = None,
+    ):
+        """
+        Escribe `title` (fila 1, opcional), la cabecera en `startrow` y los
+        datos debajo. Devuelve la hoja.
+
+        Con xlsxwriter (constant_memory) se escribe fila a fila y en orden,
+        sin pasar por to_excel; con openpyxl se usa to_excel como siempre.
+        """
+        if _XLSX_ENGINE != "xlsxwriter":
+            df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=startrow)
+            ws = writer.sheets[sheet_name]
+            if title:
+                self._write_title(ws, title)
+            return ws
+
+        # xlsxwriter devuelve -1 y se salta las filas fuera de rango sin
+        # avisar: se falla antes, igual que to_excel ("sheet is too large").
+        nrows, ncols = startrow + 1 + df.shape[0], df.shape[1]
+        if nrows > _XLSX_MAX_ROWS or ncols > _XLSX_MAX_COLS:
+            raise ValueError(
+                f"This sheet is too large! Your sheet size is: {nrows}, {ncols} "
+                f"Max sheet size is: {_XLSX_MAX_ROWS}, {_XLSX_MAX_COLS}"
+            )
+
+        book = writer.book
+        ws = book.add_worksheet(sheet_name)
+        if title:
+            self._write_title(ws, title)
+
+        header_fmt = book.add_format({"bold": True, "border": 1, "align": "center"})
+        ws.write_row(startrow, 0, [str(c) for c in df.columns], header_fmt)
+
+        cols = [_column_to_cells(df.iloc[:, i]) for i in range(df.shape[1])]
+        for r, fila in enumerate(zip(*cols), start=startrow + 1):
+            ws.write_row(r, 0, fila)
+        return ws
+
+    @staticmethod
+    def _write_title(ws, text: str) -> None:
+        if _XLSX_ENGINE == "xlsxwriter":
+            ws.write_string(0, 0, text)
+        else:
+            ws.cell(row=1, column=1, value=text)
+
+    @staticmethod
+    def _freeze_rows(ws, nrows: int) -> None:
+        """Congela las primeras `nrows` filas."""
+        if _XLSX_ENGINE == "xlsxwriter":
+            ws.freeze_panes(nrows, 0)
+        else:
+            ws.freeze_panes = ws.cell(row=nrows + 1, column=1)
+
     # ----------------- Auto-ancho columnas -----------------
 
     def _auto_width(self, ws, df: pd.DataFrame) -> None:
-        if get_column_letter is None:
+        if _XLSX_ENGINE != "xlsxwriter" and get_column_letter is None:
             return
-        for idx, col in enumerate(df.columns, start=1):
+        for idx, col in enumerate(df.columns):
             try:
-                serie = df[col].astype(str)
-                max_len = max(
-                    [len(str(col))]
-                    + [len(x) for x in serie.head(200).tolist()]
-                )
+                serie = df.iloc[:200, idx].astype(str)
+                max_len = max([len(str(col))] + [len(x) for x in serie.tolist()])
                 max_len = min(max_len + 2, 60)
-                ws.column_dimensions[get_column_letter(idx)].width = max_len
+                if _XLSX_ENGINE == "xlsxwriter":
+                    ws.set_column(idx, idx, max_len)
+                else:
+                    ws.column_dimensions[get_column_letter(idx + 1)].width = max_len
             except Exception:
                 continue
 
@@ -463,46 +1031,53 @@ class ForensicExcelReport:
         pdf_path = Path(pdf_path)
         pdf_path.parent.mkdir(parents=True, exist_ok=True)
 
+        try:
+            with open(pdf_path, "wb", buffering=_WRITE_BUFSIZE) as fh:
+                doc = SimpleDocTemplate(fh, pagesize=A4)
+                doc.build(self._pdf_flowables(max_rows_per_table))
+            print(f"  [PDF] Resumen exportado en {pdf_path}")
+        except Exception as e:
+            print(f"  [!] Error generando PDF ({pdf_path.name}): {e}")
+
+    def _pdf_flowables(self, max_rows_per_table: int) -> list:
+        """
+        Flowables del PDF: título, descripción y una LongTable por artefacto
+        con las primeras max_rows_per_table filas. ReportLab necesita la
+        lista completa para maquetar; LongTable reparte cada tabla entre
+        páginas (repitiendo la cabecera) más rápido que Table.
+        """
+        flowables = []
         styles = getSampleStyleSheet()
-        elements = []
+        table_style = TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
+                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 8),
+                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            ]
+        )
 
         for key, df in sorted(self.dfs.items(), key=lambda x: x[0]):
             sheet_name, desc = get_artifact_meta(key)
 
-            elements.append(Paragraph(f"Artefacto: {sheet_name} ({key})", styles["Heading2"]))
-            elements.append(Paragraph(desc, styles["Normal"]))
-            elements.append(Spacer(1, 6))
+            flowables.append(Paragraph(f"Artefacto: {sheet_name} ({key})", styles["Heading2"]))
+            flowables.append(Paragraph(desc, styles["Normal"]))
+            flowables.append(Spacer(1, 6))
 
             if df is None or df.empty:
-                df_norm = pd.DataFrame({"INFO": ["Sin registros."]})
-            else:
-                df_norm = df.copy()
-
-            df_small = df_norm.head(max_rows_per_table).copy()
-            data = [list(df_small.columns)] + df_small.astype(str).values.tolist()
-
-            table = Table(data, repeatRows=1)
-            table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.black),
-                        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 8),
-                        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                    ]
-                )
-            )
-            elements.append(table)
-            elements.append(Spacer(1, 18))
+                df = pd.DataFrame({"INFO": ["Sin registros."]})
 
-        doc = SimpleDocTemplate(str(pdf_path), pagesize=A4)
-        try:
-            doc.build(elements)
-            print(f"  [PDF] Resumen exportado en {pdf_path}")
-        except Exception as e:
-            print(f"  [!] Error generando PDF ({pdf_path.name}): {e}")
+            df_small = df.head(max_rows_per_table)
+            data = [[str(c) for c in df_small.columns]] + _df_to_str_rows(df_small)
+
+            table = LongTable(data, repeatRows=1, splitByRow=1)
+            table.setStyle(table_style)
+            flowables.append(table)
+            flowables.append(Spacer(1, 18))
+
+        return flowables
 
 
 # ---------------------------------------------------------------------------
@@ -633,58 +1208,113 @@ def exportar_legible(
     export_excel_resumen(dfs, export_dir / "resumen_forense.xlsx")
 
 
+_XLSX_BATCH_ROWS = 10_000  # filas por to_excel al volcar CSV -> XLSX
+_INVALID_SHEET_TRANS = str.maketrans({c: "_" for c in ":\\/?*[]"})  # no válidos en hojas
+
+
+def _iter_csv_batches(csv_path: Path) -> Iterable[pd.DataFrame]:
+    """
+    Lee un CSV (o .csv.gz) por lotes, sin cargarlo entero.
+
+    Con pyarrow se usa el lector incremental (pacsv.open_csv, un bloque
+    cada vez, en columnar). Si pyarrow no está o falla (p. ej. un bloque
+    posterior no encaja con los tipos inferidos del primero), pd.read_csv
+    por chunks de _XLSX_BATCH_ROWS continúa desde la primera fila no
+    entregada. Los CSV se escriben con BOM, de ahí "utf-8-sig".
+    """
+    entregadas = 0
+    if _PYARROW_AVAILABLE:
+        try:
+            reader = pacsv.open_csv(csv_path)
+            for batch in reader:
+                df = batch.to_pandas()
+                yield df
+                entregadas += len(df)
+            return
+        except pa.ArrowException:
+            pass
+
+    yield from pd.read_csv(
+        csv_path,
+        encoding="utf-8-sig",
+        encoding_errors="ignore",
+        skiprows=range(1, entregadas + 1) if entregadas else None,
+        chunksize=_XLSX_BATCH_ROWS,
+    )
+
+
 def crear_resumen_excel(
     legible_dir: Path,
     nombre_archivo: str = "resumen_forense.xlsx",
 ) -> None:
     """
-    Crea un Excel con TODAS las tablas legibles (.csv) que existan en la
-    carpeta `legible_dir` (una hoja por cada CSV).
+    Crea un Excel con TODAS las tablas legibles (.csv o .csv.gz) que existan
+    en la carpeta `legible_dir` (una hoja por cada CSV).
 
     Esta función no usa ForensicDataProcessor; solo mira los CSV que ya existen.
-    Útil si el usuario borra el Excel pero conserva los CSV.
+    Es SOLO para reconstruir el Excel si el usuario lo borra pero conserva
+    los CSV: el flujo normal (exportar_legible / export_all_from_dfs) escribe
+    el Excel una única vez directamente desde `dfs` con export_excel_resumen,
+    sin releer los CSV.
+
+    Los CSV se vuelcan hoja a hoja y por lotes, sin cargarlos todos a la vez.
     """
     legible_dir = Path(legible_dir)
     excel_path = legible_dir.parent / nombre_archivo
 
-    try:
-        import openpyxl  # noqa: F401
-    except ImportError:
-        print("[!] No se pudo crear el Excel: falta 'openpyxl'.")
-        print("    Instálalo con: pip install openpyxl")
-        return
+    if _XLSX_ENGINE == "openpyxl":
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            print("[!] No se pudo crear el Excel: falta 'xlsxwriter' u 'openpyxl'.")
+            print("    Instálalo con: pip install xlsxwriter")
+            return
 
-    csv_files = sorted(legible_dir.glob("*.csv"))
+    # Una entrada por tabla: si hubiera x.csv y x.csv.gz, vale el primero
+    csv_files: Dict[str, Path] = {}
+    for csv_path in sorted([*legible_dir.glob("*.csv"), *legible_dir.glob("*.csv.gz")]):
+        nombre = csv_path.name
+        nombre = nombre[: -len(".csv.gz")] if nombre.endswith(".csv.gz") else csv_path.stem
+        csv_files.setdefault(nombre, csv_path)
     if not csv_files:
         print(f"[XLSX] No hay CSV legibles en {legible_dir}, Excel no generado.")
         return
 
-    dfs: Dict[str, pd.DataFrame] = {}
-
-    for csv_path in csv_files:
-        try:
-            df = pd.read_csv(csv_path, encoding="utf-8", errors="ignore")
-        except Exception as e:
-            print(f"[!] No se pudo leer {csv_path.name} como CSV ({e}), se omite.")
-            continue
-
-        if df.empty:
-            continue
-
-        sheet_name = csv_path.stem
-        invalid_chars = [":", "\\", "/", "?", "*", "[", "]"]
-        for ch in invalid_chars:
-            sheet_name = sheet_name.replace(ch, "_")
-        sheet_name = sheet_name[:31]
+    # El writer se abre con la primera hoja con datos: un libro sin hojas
+    # no se puede guardar.
+    writer: Optional[pd.ExcelWriter] = None
+    fh = None
+    try:
+        for nombre, csv_path in csv_files.items():
+            sheet_name = nombre.translate(_INVALID_SHEET_TRANS)[:31]
 
-        dfs[sheet_name] = df
+            next_row = 0
+            try:
+                for batch in _iter_csv_batches(csv_path):
+                    if batch.empty:
+                        continue
+                    if writer is None:
+                        fh = open(excel_path, "wb", buffering=_WRITE_BUFSIZE)
+                        writer = _open_excel_writer(fh)
+                    batch.to_excel(
+                        writer,
+                        sheet_name=sheet_name,
+                        index=False,
+                        header=next_row == 0,
+                        startrow=next_row,
+                    )
+                    next_row += len(batch) + (1 if next_row == 0 else 0)
+            except Exception as e:
+                print(f"[!] No se pudo leer {csv_path.name} como CSV ({e}), se omite.")
+                continue
+    finally:
+        if writer is not None:
+            writer.close()
+        if fh is not None:
+            fh.close()
 
-    if not dfs:
+    if writer is None:
         print("[XLSX] No hay datos útiles para el Excel, no se genera archivo.")
         return
 
-    with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
-        for sheet_name, df in dfs.items():
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-
     print(f"[XLSX] Excel resumen generado -> {excel_path}")
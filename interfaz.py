@@ -13,18 +13,18 @@ Estructura:
 - QStackedWidget a la derecha con:
     * HomeView
     * AnalysisView
-    * ExportView (placeholder si no existe)
+    * ExportView
     * SettingsView
 - LoadingIndicator abajo para mostrar el progreso global.
-- Usa forensic_bridge.run_forensic_from_cfg() en un QThread para no
-  congelar la interfaz.
+- Usa forensic_bridge.run_forensic_from_cfg() en el QThreadPool global
+  (AnalysisRunnable) para no congelar la interfaz.
 """
 
 from __future__ import annotations
 
-from __future__ import annotations
-
+import logging
 import sys
+from collections import deque
 from pathlib import Path
 
 
@@ -34,20 +34,7 @@ SOURCE_DIR = BASE_DIR / "source"                  # proyecto/source
 if str(SOURCE_DIR) not in sys.path:
     sys.path.insert(0, str(SOURCE_DIR))
 
-from PySide6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QStackedWidget
-from PySide6.QtCore import Qt, QThread, Signal, QObject
-
-from theme.theme_dark import DARK_STYLESHEET
-from components.header_bar import HeaderBar
-from components.side_nav import SideNav
-from components.loading_indicator import LoadingIndicator
-
-from view.home_view import HomeView
-from view.analysis_view import AnalysisView
-from view.settings_view import SettingsView
-from forensic_bridge import run_forensic_from_cfg
-
-from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread
+from PySide6.QtCore import QObject, Signal, Slot, QRunnable, QThreadPool, QTimer
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -55,53 +42,57 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QStackedWidget,
-    QLabel,
     QMessageBox,
 )
 
+from theme.theme_dark import DARK_STYLESHEET
+from components.header_bar import HeaderBar
+from components.side_nav import SideNav
+from components.loading_indicator import LoadingIndicator
 
+from view.home_view import HomeView
+# AnalysisView / ExportView / SettingsView se importan en su _build_*_view
+from forensic_bridge import run_forensic_from_cfg
 
-
-# ----------------------------------------------------------------------
-# ExportView: si la tienes en view/export_view.py, se usa; si no, placeholder
-# ----------------------------------------------------------------------
-try:
-    from view.export_view import ExportView  # type: ignore
-except ImportError:
-    class ExportView(QWidget):
-        def __init__(self, parent=None):
-            super().__init__(parent)
-            lay = QVBoxLayout(self)
-            lbl = QLabel(
-                "<b>Exportación</b><br><br>"
-                "Vista de exportación aún no implementada.<br>"
-                "Puedes crear view/export_view.py más adelante."
-            )
-            lbl.setWordWrap(True)
-            lay.addWidget(lbl)
-            lay.addStretch()
+log = logging.getLogger(__name__)
 
 
 # ======================================================================
 # Worker para ejecutar el análisis en segundo plano
 # ======================================================================
 
-class AnalysisWorker(QObject):
+class AnalysisSignals(QObject):
+    """Señales de AnalysisRunnable (un QRunnable no es QObject)."""
     finished = Signal(str)      # ruta de carpeta del caso
     error = Signal(str)         # mensaje de error
-    progress = Signal(str)      # mensajes de progreso (logs)
 
-    def __init__(self, cfg: dict, base_dir: Path, parent=None):
-        super().__init__(parent)
+
+# Cada cuánto la GUI vuelca los mensajes de progreso acumulados por el
+# backend: así se pinta una vez por tanda, no una vez por línea de log.
+PROGRESS_FLUSH_MS = 50
+
+
+class AnalysisRunnable(QRunnable):
+    """
+    Trabajo de análisis para QThreadPool.globalInstance(): reutiliza los
+    hilos del pool en vez de crear (y destruir) un QThread por ejecución.
+
+    Los mensajes del backend no cruzan el hilo como señales: progress_cb
+    es self.messages.append (deque, seguro entre hilos) y la ventana los
+    recoge con un QTimer cada PROGRESS_FLUSH_MS.
+    """
+
+    def __init__(self, cfg: dict, base_dir: Path):
+        super().__init__()
         self._cfg = cfg
         self._base_dir = base_dir
+        self.signals = AnalysisSignals()
+        self.messages: deque[str] = deque()
 
-    @Slot()
     def run(self):
         """
         Ejecuta todo el flujo forense usando forensic_bridge.run_forensic_from_cfg.
-        Emite:
-        - progress(msg) cada vez que el backend informe algo.
+        Emite (vía self.signals):
         - finished(case_dir) al terminar bien.
         - error(str) si ocurre una excepción.
         """
@@ -109,11 +100,11 @@ class AnalysisWorker(QObject):
             case_dir = run_forensic_from_cfg(
                 self._cfg,
                 self._base_dir,
-                progress_cb=self.progress.emit,
+                progress_cb=self.messages.append,
             )
-            self.finished.emit(case_dir)
+            self.signals.finished.emit(case_dir)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 # ======================================================================
@@ -130,14 +121,24 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Android Forensic Extractor")
         self.resize(1200, 720)
 
-        # Status bar (aprovecha el estilo del theme_dark)
-        self.statusBar()
+        # Status bar (aprovecha el estilo del theme_dark); se guarda una vez
+        self._status_bar = self.statusBar()
 
-        # Flags / referencias de hilo de análisis
-        self._analysis_thread: QThread | None = None
-        self._analysis_worker: AnalysisWorker | None = None
+        # Flags / referencias del análisis en curso. Se guardan las señales
+        # del runnable: el pool es dueño del QRunnable y lo borra al acabar.
+        self._analysis_signals: AnalysisSignals | None = None
+        self._analysis_messages: deque[str] | None = None
         self._analysis_running: bool = False
 
+        # Volcado periódico de los mensajes de progreso del análisis
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self._drain_analysis_progress)
+
+        # Un QMessageBox por tipo (aviso / info / error), creado la primera
+        # vez que se usa y reutilizado después (ver _show_message)
+        self._msg_boxes: dict[QMessageBox.Icon, QMessageBox] = {}
+
         # ----------------- Central widget -----------------
         central = QWidget()
         self.setCentralWidget(central)
@@ -160,18 +161,22 @@ class MainWindow(QMainWindow):
         self.side_nav = SideNav()
         body_layout.addWidget(self.side_nav)
 
-        # Stacked views
+        # Stacked views. Solo Inicio se construye ya; el resto se crea la
+        # primera vez que se navega a él (_ensure_view), sobre un QWidget
+        # vacío que ocupa su índice hasta entonces.
         self.view_stack = QStackedWidget()
         self.home_view = HomeView()
-        self.analysis_view = AnalysisView()
-        self.export_view = ExportView()
-        self.settings_view = SettingsView()
 
         # Orden debe coincidir con SideNav (Inicio, Análisis, Exportación, Configuración)
         self.view_stack.addWidget(self.home_view)      # index 0
-        self.view_stack.addWidget(self.analysis_view)  # index 1
-        self.view_stack.addWidget(self.export_view)    # index 2
-        self.view_stack.addWidget(self.settings_view)  # index 3
+        self.view_stack.addWidget(QWidget())           # index 1 -> AnalysisView
+        self.view_stack.addWidget(QWidget())           # index 2 -> ExportView
+        self.view_stack.addWidget(QWidget())           # index 3 -> SettingsView
+        self._view_builders = {
+            1: self._build_analysis_view,
+            2: self._build_export_view,
+            3: self._build_settings_view,
+        }
 
         body_layout.addWidget(self.view_stack, 1)
 
@@ -187,11 +192,6 @@ class MainWindow(QMainWindow):
         self.header_bar.deviceDetected.connect(self._on_device_detected)
         self.header_bar.detectionFailed.connect(self._on_detection_failed)
 
-        self.settings_view.runSetupRequested.connect(self._on_run_setup)
-
-        # Botón principal de análisis
-        self.analysis_view.btn_run.clicked.connect(self._on_run_analysis)
-
         # Vista inicial
         self.view_stack.setCurrentIndex(0)
 
@@ -199,60 +199,99 @@ class MainWindow(QMainWindow):
     # Callbacks de navegación
     # ==================================================================
 
+    @Slot(int)
     def _on_nav_changed(self, index: int):
         """Cambia la vista activa según el botón del SideNav."""
         if 0 <= index < self.view_stack.count():
+            self._ensure_view(index)
             self.view_stack.setCurrentIndex(index)
 
+    def _ensure_view(self, index: int):
+        """Construye la vista de `index` si aún es el QWidget de relleno."""
+        builder = self._view_builders.pop(index, None)
+        if builder is None:
+            return
+        placeholder = self.view_stack.widget(index)
+        self.view_stack.insertWidget(index, builder())
+        self.view_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+    def _build_analysis_view(self) -> QWidget:
+        from view.analysis_view import AnalysisView  # arrastra ModeSelector
+
+        self.analysis_view = AnalysisView()
+        # Botón principal de análisis
+        self.analysis_view.btn_run.clicked.connect(self._on_run_analysis)
+        return self.analysis_view
+
+    def _build_export_view(self) -> QWidget:
+        from view.export_view import ExportView
+
+        self.export_view = ExportView()
+        return self.export_view
+
+    def _build_settings_view(self) -> QWidget:
+        from view.settings_view import SettingsView
+
+        self.settings_view = SettingsView()
+        self.settings_view.runSetupRequested.connect(self._on_run_setup)
+        return self.settings_view
+
     # ==================================================================
     # Callbacks de HeaderBar (detección de dispositivo)
     # ==================================================================
 
+    @Slot(str)
     def _on_device_detected(self, device_id: str):
         """Cuando HeaderBar detecta un dispositivo ADB."""
-        self.statusBar().showMessage(f"Dispositivo detectado: {device_id}", 5000)
+        self._status_bar.showMessage(f"Dispositivo detectado: {device_id}", 5000)
 
+    @Slot(str)
     def _on_detection_failed(self, message: str):
         """Cuando falla la detección del dispositivo."""
-        QMessageBox.warning(
-            self,
+        self._show_message(
+            QMessageBox.Warning,
             "Detección de dispositivo",
             message,
         )
-        self.statusBar().showMessage("Sin dispositivo conectado", 5000)
+        self._status_bar.showMessage("Sin dispositivo conectado", 5000)
 
     # ==================================================================
     # Callbacks de SettingsView y AnalysisView (acciones principales)
     # ==================================================================
 
+    @Slot()
     def _on_run_setup(self):
         """
         Aquí más adelante puedes llamar a setup.py con subprocess.
         Por ahora solo mostramos un mensaje.
         """
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             "Setup",
             "Aquí se ejecutaría setup.py para configurar el entorno.\n"
             "Integración pendiente.",
         )
 
+    @Slot()
     def _on_run_analysis(self):
         """
         Acción del botón 'Iniciar análisis' de AnalysisView.
-        Lanza un QThread con AnalysisWorker para no congelar la GUI.
+        Lanza un AnalysisRunnable en el QThreadPool global para no congelar
+        la GUI.
         """
         if self._analysis_running:
-            QMessageBox.information(
-                self,
+            self._show_message(
+                QMessageBox.Information,
                 "Análisis en ejecución",
                 "Ya hay un análisis corriendo. Espera a que termine.",
             )
             return
 
         cfg = self.analysis_view.get_config()
-        # DEBUG opcional
-        print("Config análisis:", cfg)
+        # DEBUG opcional (con el nivel por defecto no se formatea ni escribe)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Config análisis: %s", cfg)
 
         # Limpiar log y poner la UI en modo ocupado
         self.analysis_view.clear_log()
@@ -262,65 +301,91 @@ class MainWindow(QMainWindow):
         # Barra de carga global
         self.loading_indicator.start("Analizando dispositivo...")
 
-        # Preparar worker + hilo
-        self._analysis_thread = QThread(self)
-        self._analysis_worker = AnalysisWorker(cfg, self.base_dir)
-
-        self._analysis_worker.moveToThread(self._analysis_thread)
-
-        # Conexiones de worker
-        self._analysis_thread.started.connect(self._analysis_worker.run)
-        self._analysis_worker.progress.connect(self._on_analysis_progress)
-        self._analysis_worker.finished.connect(self._on_analysis_finished)
-        self._analysis_worker.error.connect(self._on_analysis_error)
+        # Preparar el trabajo; sus señales llegan a la GUI como queued
+        runnable = AnalysisRunnable(cfg, self.base_dir)
+        signals = runnable.signals
+        signals.finished.connect(self._on_analysis_finished)
+        signals.error.connect(self._on_analysis_error)
 
         # Limpieza al terminar
-        self._analysis_worker.finished.connect(self._cleanup_analysis_thread)
-        self._analysis_worker.error.connect(self._cleanup_analysis_thread)
+        signals.finished.connect(self._cleanup_analysis_job)
+        signals.error.connect(self._cleanup_analysis_job)
 
+        self._analysis_signals = signals
+        self._analysis_messages = runnable.messages
         self._analysis_running = True
-        self._analysis_thread.start()
+        self._progress_timer.start()
+        QThreadPool.globalInstance().start(runnable)
 
-    @Slot(str)
-    def _on_analysis_progress(self, msg: str):
-        """Mensajes de progreso desde forensic_bridge / extractores."""
-        self.analysis_view.append_log(msg)
-        self.loading_indicator.set_message(msg)
+    @Slot()
+    def _drain_analysis_progress(self):
+        """Pinta de una vez los mensajes de progreso acumulados por el backend."""
+        messages = self._analysis_messages
+        if not messages:
+            return
+        batch = []
+        while messages:
+            batch.append(messages.popleft())
+        self.analysis_view.append_log("\n".join(batch))
+        self.loading_indicator.set_message(batch[-1])
 
     @Slot(str)
     def _on_analysis_finished(self, case_dir: str):
         """Cuando el análisis termina correctamente."""
+        self._drain_analysis_progress()
         self.analysis_view.append_log(
             f"\n[OK] Análisis completado.\nCarpeta del caso: {case_dir}"
         )
         self.analysis_view.set_busy(False, "Análisis completado.")
         self.loading_indicator.stop("Análisis completado.")
-        self.statusBar().showMessage(f"Análisis completado. Carpeta: {case_dir}", 8000)
+        self._status_bar.showMessage(f"Análisis completado. Carpeta: {case_dir}", 8000)
         self._analysis_running = False
 
     @Slot(str)
     def _on_analysis_error(self, err: str):
         """Cuando el análisis lanza una excepción."""
+        self._drain_analysis_progress()
         self.analysis_view.append_log(
             f"\n[ERROR] Ocurrió un problema durante el análisis:\n{err}"
         )
         self.analysis_view.set_busy(False, "Error en el análisis.")
         self.loading_indicator.stop("Error en el análisis.")
-        QMessageBox.critical(
-            self,
+        self._show_message(
+            QMessageBox.Critical,
             "Error en análisis",
             f"Ocurrió un error durante el análisis:\n\n{err}",
         )
-        self.statusBar().showMessage("Error en el análisis.", 8000)
+        self._status_bar.showMessage("Error en el análisis.", 8000)
         self._analysis_running = False
 
-    def _cleanup_analysis_thread(self, *args):
-        """Detiene y limpia el hilo de análisis."""
-        if self._analysis_thread:
-            self._analysis_thread.quit()
-            self._analysis_thread.wait()
-        self._analysis_thread = None
-        self._analysis_worker = None
+    # ==================================================================
+    # Diálogos
+    # ==================================================================
+
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """
+        Equivalente a QMessageBox.warning/information/critical, pero
+        reutiliza un diálogo por tipo en lugar de crear uno nuevo cada vez.
+        Si el de ese tipo ya está abierto (otro aviso llegó mientras tanto),
+        se usa uno temporal.
+        """
+        box = self._msg_boxes.get(icon)
+        temporary = box is not None and box.isVisible()
+        if box is None or temporary:
+            box = QMessageBox(icon, "", "", QMessageBox.Ok, self)
+            if not temporary:
+                self._msg_boxes[icon] = box
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec()
+        if temporary:
+            box.deleteLater()
+
+    def _cleanup_analysis_job(self, *args):
+        """Suelta las señales del análisis terminado (el hilo vuelve al pool)."""
+        self._progress_timer.stop()
+        self._analysis_signals = None
+        self._analysis_messages = None
 
 
     # ==================================================================
@@ -328,6 +393,7 @@ class MainWindow(QMainWindow):
     # ==================================================================
 
 def run_gui(base_dir: Path | None = None):
+    logging.basicConfig(level=logging.INFO)
     app = QApplication(sys.argv)
     app.setStyleSheet(DARK_STYLESHEET)
 
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -18,10 +19,15 @@ for p in (SOURCE_DIR, CORE_DIR):
     if p.is_dir() and str(p) not in sys.path:
         sys.path.insert(0, str(p))
 
-# Ahora ya podemos importar la interfaz sin problemas
-from interfaz import run_gui
-
 
 if __name__ == "__main__":
+    # Necesario en el ejecutable de PyInstaller: el parseo de volcados grandes
+    # (procesador_legible) usa procesos hijos.
+    multiprocessing.freeze_support()
+
+    # La interfaz (y PySide6) se importa aquí: los procesos hijos que
+    # reimportan este módulo no cargan Qt.
+    from interfaz import run_gui
+
     # base_dir lo usamos para crear /casos, /logs, etc.
     run_gui(base_dir=ROOT_DIR)
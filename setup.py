@@ -8,12 +8,15 @@ setup.py - Configurador del entorno para Android Forensic Extractor
 - Verifica ADB. Si no está, descarga platform-tools de Google y lo agrega al PATH.
 """
 
+import functools
+import io
 import os
 import sys
 import subprocess
 import zipfile
-import tempfile
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, distribution
 from pathlib import Path
 import platform
 
@@ -31,6 +34,8 @@ REQUIRED_PYTHON_PACKAGES = [
     "pandas",
     "PySide6",
     "openpyxl",
+    "xlsxwriter",
+    "lxml",
     "PILLOW",
     "reportlab"
     # agrega aquí más paquetes si los usas: "numpy", "matplotlib", ...
@@ -40,6 +45,10 @@ BASE_DIR = Path(__file__).resolve().parent
 TOOLS_DIR = BASE_DIR / "tools"
 PLATFORM_TOOLS_DIR = TOOLS_DIR / "platform-tools"
 
+# Marca de "setup completo": si es más reciente que este archivo, main()
+# no vuelve a comprobar paquetes ni ADB.
+SETUP_SENTINEL = BASE_DIR / ".setup_ok"
+
 
 # -------------------------------------------------------------------
 # UTILIDADES
@@ -56,6 +65,27 @@ def run_cmd(cmd, **kwargs):
     return result.returncode, result.stdout, result.stderr
 
 
+# En Windows evita que cada sonda abra (y haga parpadear) una consola
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
+def run_cmd_rc(cmd):
+    """
+    Ejecuta un comando descartando su salida y devuelve solo el código
+    de salida (sin pipes ni decodificación). Si el ejecutable no existe
+    devuelve 127, como haría la shell.
+    """
+    try:
+        return subprocess.call(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=_NO_WINDOW,
+        )
+    except OSError:
+        return 127
+
+
 def check_python_version():
     """Verifica que la versión de Python sea razonable (>= 3.8)."""
     major, minor = sys.version_info[:2]
@@ -67,38 +97,69 @@ def check_python_version():
     print(f"[OK] Python {major}.{minor} detectado.")
 
 
-def ensure_python_packages(packages):
-    """Verifica e instala (si falta) cada paquete de Python."""
+def missing_python_packages(packages, verbose=False):
+    """Devuelve los paquetes sin metadatos de instalación (sin importarlos)."""
+    missing = []
     for pkg in packages:
         try:
-            __import__(pkg)
-            print(f"[OK] Paquete Python '{pkg}' ya instalado.")
-        except ImportError:
-            print(f"[*] Instalando paquete Python '{pkg}'...")
-            try:
-                subprocess.check_call(
-                    [sys.executable, "-m", "pip", "install", pkg]
-                )
-                print(f"[OK] Paquete '{pkg}' instalado correctamente.")
-            except subprocess.CalledProcessError as e:
-                print(f"[!] No se pudo instalar el paquete '{pkg}': {e}")
+            distribution(pkg)
+            if verbose:
+                print(f"[OK] Paquete Python '{pkg}' ya instalado.")
+        except PackageNotFoundError:
+            missing.append(pkg)
+    return missing
+
+
+def ensure_python_packages(packages):
+    """
+    Verifica cada paquete de Python por sus metadatos de instalación (no
+    importa ni busca módulos) e instala todos los que falten con una sola
+    llamada a pip. Devuelve True si al final están todos.
+    """
+    missing = missing_python_packages(packages, verbose=True)
+    if not missing:
+        return True
+
+    print(f"[*] Instalando paquetes Python: {', '.join(missing)}...")
+    try:
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install",
+             "--disable-pip-version-check", "--no-input", *missing]
+        )
+        print("[OK] Paquetes instalados correctamente.")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"[!] No se pudieron instalar los paquetes {missing}: {e}")
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _adb_in_path_cached():
+    return run_cmd_rc(["adb", "version"]) == 0
 
 
-def adb_in_path():
-    """Devuelve True si adb responde en la consola."""
-    rc, out, err = run_cmd(["adb", "version"])
-    return rc == 0
+def adb_in_path(force=False):
+    """
+    Devuelve True si adb responde en la consola.
+    El resultado se recuerda durante la ejecución; force=True vuelve a
+    lanzar 'adb version' (p. ej. tras modificar el PATH).
+    """
+    if force:
+        _adb_in_path_cached.cache_clear()
+    return _adb_in_path_cached()
 
 
 def download_platform_tools():
-    """Descarga platform-tools y lo descomprime en tools/platform-tools."""
+    """
+    Descarga platform-tools y lo descomprime en tools/platform-tools.
+    El ZIP (~15 MB) se descarga a memoria y se extrae desde ahí, sin
+    escribirlo a un archivo temporal para luego volver a leerlo.
+    """
     TOOLS_DIR.mkdir(exist_ok=True)
     print("[*] Descargando Android platform-tools desde Google...")
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-        tmp_path = tmp.name
-
     try:
-        urllib.request.urlretrieve(PLATFORM_TOOLS_URL, tmp_path)
+        with urllib.request.urlopen(PLATFORM_TOOLS_URL) as resp:
+            data = resp.read()
     except Exception as e:
         print(f"[ERROR] No se pudo descargar platform-tools: {e}")
         print("       Descárgalo manualmente desde la web de Android SDK.")
@@ -106,16 +167,11 @@ def download_platform_tools():
 
     print("[*] Descomprimiendo platform-tools...")
     try:
-        with zipfile.ZipFile(tmp_path, "r") as zf:
+        with zipfile.ZipFile(io.BytesIO(data), "r") as zf:
             zf.extractall(TOOLS_DIR)
     except Exception as e:
         print(f"[ERROR] No se pudo descomprimir el ZIP: {e}")
         return False
-    finally:
-        try:
-            os.remove(tmp_path)
-        except OSError:
-            pass
 
     if PLATFORM_TOOLS_DIR.exists():
         print(f"[OK] platform-tools extraído en: {PLATFORM_TOOLS_DIR}")
@@ -125,36 +181,64 @@ def download_platform_tools():
     return False
 
 
-def add_to_path_win(directory: Path):
+def add_to_path_win(directory: Path, persist=False):
     """
-    Añade 'directory' al PATH del proceso y al PATH de usuario en Windows usando setx.
-    (Puede requerir cerrar y abrir la consola para que se refleje).
+    Añade 'directory' al PATH del proceso (suficiente para esta ejecución).
+    Con persist=True (en Windows) lo añade además al PATH de usuario,
+    escribiendo HKCU\\Environment\\Path con winreg: sin 'setx', que es lento
+    y trunca el PATH a 1024 caracteres.
+    (Las consolas ya abiertas no ven el cambio: hay que abrir una nueva).
     """
     directory = str(directory)
     current_path = os.environ.get("PATH", "")
 
-
     if directory not in current_path:
         os.environ["PATH"] = directory + os.pathsep + current_path
 
-    if os.name == "nt":
-        if directory.lower() in current_path.lower():
-            print("[OK] Directorio ya estaba en el PATH del usuario.")
-            return
+    if not persist or os.name != "nt":
+        return
+
+    import winreg
+
+    try:
+        with winreg.OpenKey(
+            winreg.HKEY_CURRENT_USER, "Environment", 0,
+            winreg.KEY_READ | winreg.KEY_WRITE,
+        ) as key:
+            try:
+                user_path, kind = winreg.QueryValueEx(key, "Path")
+            except FileNotFoundError:
+                user_path, kind = "", winreg.REG_EXPAND_SZ
+
+            entries = [p for p in user_path.split(os.pathsep) if p]
+            if directory.lower() in (p.lower() for p in entries):
+                print("[OK] Directorio ya estaba en el PATH del usuario.")
+                return
+
+            if kind not in (winreg.REG_SZ, winreg.REG_EXPAND_SZ):
+                kind = winreg.REG_EXPAND_SZ
+            entries.append(directory)
+            winreg.SetValueEx(key, "Path", 0, kind, os.pathsep.join(entries))
+    except OSError as e:
+        print(f"[!] No se pudo actualizar el PATH de usuario: {e}")
+        return
 
-        new_path = current_path + os.pathsep + directory
-        print("[*] Actualizando PATH del usuario con setx (puede tardar un momento)...")
-        cmd = f'setx PATH "{new_path}"'
-        subprocess.run(cmd, shell=True)
-        print(f"[OK] PATH de usuario actualizado con: {directory}")
-        print("     Es posible que debas CERRAR y ABRIR la terminal para que surta efecto.")
+    print(f"[OK] PATH de usuario actualizado con: {directory}")
+    print("     Es posible que debas CERRAR y ABRIR la terminal para que surta efecto.")
 
 
-def ensure_adb():
-    """Verifica ADB; si no está, ofrece descargar e instalar platform-tools."""
-    if adb_in_path():
+def ensure_adb(adb_ok=None):
+    """
+    Verifica ADB; si no está, ofrece descargar e instalar platform-tools.
+    adb_ok: resultado de adb_in_path() ya calculado (main lo lanza en
+    paralelo); si es None se comprueba aquí.
+    Devuelve True si adb queda disponible.
+    """
+    if adb_ok is None:
+        adb_ok = adb_in_path()
+    if adb_ok:
         print("[OK] 'adb' detectado en el PATH.")
-        return
+        return True
 
     print("[!] No se encontró 'adb' en el PATH.")
     resp = input(
@@ -164,33 +248,43 @@ def ensure_adb():
     if resp.startswith("n"):
         print("[-] No se instalará adb automáticamente. "
               "Instálalo manualmente y vuelve a ejecutar setup.py.")
-        return
+        return False
 
     if platform.system().lower() != "windows":
         print("[!] Este instalador automático de platform-tools está pensado para Windows.")
         print("    Descarga platform-tools manualmente para tu sistema operativo.")
-        return
+        return False
 
     ok = download_platform_tools()
     if not ok:
         print("[!] Error al descargar/instalar platform-tools.")
-        return
+        return False
 
-    add_to_path_win(PLATFORM_TOOLS_DIR)
+    # Recién instalado: se guarda también en el PATH de usuario
+    add_to_path_win(PLATFORM_TOOLS_DIR, persist=True)
 
-    # Re-verificar
-    if adb_in_path():
+    # Re-verificar (el PATH ha cambiado: no vale el resultado anterior)
+    if adb_in_path(force=True):
         print("[OK] 'adb' ahora está disponible.")
-    else:
-        print("[!] 'adb' aún no responde. Prueba cerrando y abriendo la consola.")
-        print("    Si el problema continúa, revisa manualmente la configuración del PATH.")
+        return True
+
+    print("[!] 'adb' aún no responde. Prueba cerrando y abriendo la consola.")
+    print("    Si el problema continúa, revisa manualmente la configuración del PATH.")
+    return False
 
 
-def check_java(optional=True):
+def java_rc():
+    """Código de salida de 'java -version' (0 = Java disponible)."""
+    return run_cmd_rc(["java", "-version"])
+
+
+def check_java(optional=True, rc=None):
     """
     Comprueba si Java está instalado (opcional, pero útil para abe.jar y backups .ab).
+    rc: resultado de java_rc() ya calculado; si es None se comprueba aquí.
     """
-    rc, out, err = run_cmd(["java", "-version"])
+    if rc is None:
+        rc = java_rc()
     if rc == 0:
         print("[OK] Java detectado (necesario para usar abe.jar con backups .ab).")
     else:
@@ -200,11 +294,23 @@ def check_java(optional=True):
         print(msg)
 
 
+def setup_is_current():
+    """True si SETUP_SENTINEL existe y es posterior a setup.py (un stat cada uno)."""
+    try:
+        return SETUP_SENTINEL.stat().st_mtime >= Path(__file__).stat().st_mtime
+    except OSError:
+        return False
+
+
 # -------------------------------------------------------------------
 # MAIN
 # -------------------------------------------------------------------
 
-def main():
+def main(force=False):
+    """
+    force=True ignora SETUP_SENTINEL y repite todas las comprobaciones
+    (también con 'python setup.py --force').
+    """
     print("===========================================")
     print("   ANDROID FORENSIC EXTRACTOR - setup.py   ")
     print("===========================================")
@@ -212,14 +318,38 @@ def main():
 
     check_python_version()
 
-    print("\n[*] Verificando / instalando paquetes de Python necesarios...")
-    ensure_python_packages(REQUIRED_PYTHON_PACKAGES)
+    if not force and setup_is_current():
+        # platform-tools descargado por un setup anterior: basta con el PATH
+        # del proceso. Aun así se confirma que adb responde y que los
+        # paquetes siguen instalados (solo metadatos, sin pip), por si se
+        # borraron después de crear SETUP_SENTINEL.
+        if PLATFORM_TOOLS_DIR.exists():
+            add_to_path_win(PLATFORM_TOOLS_DIR)
+        if adb_in_path() and not missing_python_packages(REQUIRED_PYTHON_PACKAGES):
+            print(f"[OK] Entorno ya configurado ({SETUP_SENTINEL.name}). "
+                  "Usa --force para comprobarlo de nuevo.")
+            return
+        print(f"[!] {SETUP_SENTINEL.name} existe pero falta ADB o algún paquete: "
+              "se repiten las comprobaciones.")
+        SETUP_SENTINEL.unlink(missing_ok=True)
+
+    # Las sondas 'adb version' y 'java -version' no dependen de los paquetes
+    # de Python: se lanzan ya y se recogen en el orden de siempre.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        f_adb = pool.submit(adb_in_path)
+        f_java = pool.submit(java_rc)
+
+        print("\n[*] Verificando / instalando paquetes de Python necesarios...")
+        packages_ok = ensure_python_packages(REQUIRED_PYTHON_PACKAGES)
+
+        print("\n[*] Verificando disponibilidad de ADB...")
+        adb_ok = ensure_adb(adb_ok=f_adb.result())
 
-    print("\n[*] Verificando disponibilidad de ADB...")
-    ensure_adb()
+        print("\n[*] Comprobando Java (opcional para manejo de .ab / abe.jar)...")
+        check_java(optional=True, rc=f_java.result())
 
-    print("\n[*] Comprobando Java (opcional para manejo de .ab / abe.jar)...")
-    check_java(optional=True)
+    if packages_ok and adb_ok:
+        SETUP_SENTINEL.touch()
 
     print("\n===========================================")
     print("  Setup finalizado.")
@@ -229,4 +359,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(force="--force" in sys.argv[1:])
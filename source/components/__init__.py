@@ -1,6 +1,18 @@
 # source/Components/__init__.py
-from .header_bar import HeaderBar
-from .side_nav import SideNav
-from .loading_indicator import LoadingIndicator
+# Imports perezosos (PEP 562): cada componente (y con él PySide6) se carga
+# la primera vez que se pide, no al importar el paquete.
+from importlib import import_module
 
-__all__ = ["HeaderBar", "SideNav", "LoadingIndicator"]
+_EXPORTS = {
+    "HeaderBar": ".header_bar",
+    "SideNav": ".side_nav",
+    "LoadingIndicator": ".loading_indicator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
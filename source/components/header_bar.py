@@ -2,10 +2,36 @@
 # -*- coding: utf-8 -*-
 
 import sys
-from PySide6.QtCore import Qt, Signal
+import time
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton
 
 
+# Segundos durante los que se reutiliza el último dispositivo detectado
+# (clics repetidos no vuelven a lanzar 'adb devices').
+DETECT_TTL_SEC = 2.0
+
+
+class _DetectSignals(QObject):
+    detected = Signal(str)
+    failed = Signal(str)
+
+
+class _DetectRunnable(QRunnable):
+    """Llama a analisis.detect_device() (adb devices) fuera del hilo de la GUI."""
+
+    def __init__(self, analisis):
+        super().__init__()
+        self._analisis = analisis
+        self.signals = _DetectSignals()
+
+    def run(self):
+        try:
+            self.signals.detected.emit(self._analisis.detect_device())
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
 class HeaderBar(QWidget):
     """
     Barra superior de la interfaz.
@@ -25,8 +51,7 @@ class HeaderBar(QWidget):
 
         # Título
         self.lbl_title = QLabel("Android Forensic Extractor")
-        self.lbl_title.setObjectName("HeaderTitle")
-        self.lbl_title.setStyleSheet("font-size: 16px; font-weight: 600;")
+        self.lbl_title.setObjectName("HeaderTitle")  # estilo en DARK_STYLESHEET
         layout.addWidget(self.lbl_title)
 
         layout.addStretch()
@@ -34,7 +59,6 @@ class HeaderBar(QWidget):
         # Estado dispositivo
         self.lbl_device = QLabel("Sin dispositivo")
         self.lbl_device.setObjectName("HeaderDevice")
-        self.lbl_device.setStyleSheet("color: #bbbbbb;")
         layout.addWidget(self.lbl_device)
 
         # Botón
@@ -45,10 +69,17 @@ class HeaderBar(QWidget):
 
         self.btn_detect.clicked.connect(self.on_click_detect)
 
+        self._detect_signals: _DetectSignals | None = None
+        self._last_detect_ts = 0.0
+        self._last_detect_id: str | None = None
+
     # ------------------------------------------------------------------
+    @Slot()
     def on_click_detect(self):
         """
         Al pulsar, usa analisis.detect_device() si el módulo está cargado.
+        La llamada a adb (que puede tardar si arranca el servidor) se hace
+        en el QThreadPool global; el resultado llega por señales.
         """
         analisis = sys.modules.get("analisis")
         if analisis is None:
@@ -60,10 +91,35 @@ class HeaderBar(QWidget):
             self.detectionFailed.emit(msg)
             return
 
-        try:
-            dev_id = analisis.detect_device()
-            self.lbl_device.setText(f"Dispositivo: {dev_id}")
-            self.deviceDetected.emit(dev_id)
-        except Exception as e:
-            self.lbl_device.setText("Sin dispositivo")
-            self.detectionFailed.emit(str(e))
+        if (
+            self._last_detect_id
+            and time.monotonic() - self._last_detect_ts < DETECT_TTL_SEC
+        ):
+            self.deviceDetected.emit(self._last_detect_id)
+            return
+
+        runnable = _DetectRunnable(analisis)
+        runnable.signals.detected.connect(self._on_detected)
+        runnable.signals.failed.connect(self._on_failed)
+        self._detect_signals = runnable.signals
+
+        self.btn_detect.setEnabled(False)
+        self.lbl_device.setText("Detectando...")
+        QThreadPool.globalInstance().start(runnable)
+
+    @Slot(str)
+    def _on_detected(self, dev_id: str):
+        self._detect_signals = None
+        self._last_detect_id = dev_id
+        self._last_detect_ts = time.monotonic()
+        self.btn_detect.setEnabled(True)
+        self.lbl_device.setText(f"Dispositivo: {dev_id}")
+        self.deviceDetected.emit(dev_id)
+
+    @Slot(str)
+    def _on_failed(self, message: str):
+        self._detect_signals = None
+        self._last_detect_id = None
+        self.btn_detect.setEnabled(True)
+        self.lbl_device.setText("Sin dispositivo")
+        self.detectionFailed.emit(message)
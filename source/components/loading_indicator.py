@@ -7,7 +7,9 @@ class LoadingIndicator(QWidget):
     """
     Barra de carga para mostrar abajo de la ventana:
     - Mensaje de qué se está haciendo.
-    - Barra indeterminada (modo "trabajando") o con progreso.
+    - Icono fijo (modo "trabajando") o barra con progreso. No se usa una
+      barra indeterminada: su animación repinta cada ~30 ms mientras dure
+      el trabajo, y el mensaje ya indica que hay algo en curso.
     
     Uso básico (como antes):
         loading.start("Analizando dispositivo...")
@@ -34,16 +36,20 @@ class LoadingIndicator(QWidget):
         layout.setContentsMargins(8, 4, 8, 4)
         layout.setSpacing(10)
 
+        self.icon = QLabel("⏳")
+        self.icon.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
+        self.icon.setVisible(False)
+
         self.label = QLabel("Listo.")
         self.label.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
 
         self.progress = QProgressBar()
         self.progress.setTextVisible(False)   # el % lo mostramos en el label
         self.progress.setFixedHeight(8)
-        # 0,1 = sin animación; 0,0 = indeterminado (animación)
         self.progress.setRange(0, 1)
         self.progress.setValue(1)
 
+        layout.addWidget(self.icon)
         layout.addWidget(self.label, 1)
         layout.addWidget(self.progress, 2)
 
@@ -52,23 +58,29 @@ class LoadingIndicator(QWidget):
         self._current_step: int = 0
         self._base_message: str = "Listo."
 
+        # Último texto mostrado: evita setText (y su repintado) si no cambia
+        self._last_text: str = "Listo."
+
     # ------------------ API pública ------------------
 
     def start(self, message: str, total_steps: int | None = None):
         """
-        Muestra el componente y pone la barra en modo:
-        - indeterminado si total_steps es None
-        - determinista si total_steps es un entero > 0
+        Muestra el componente:
+        - con el icono fijo (sin barra) si total_steps es None
+        - con la barra determinista si total_steps es un entero > 0
         """
         self._base_message = message
         self._current_step = 0
         self._total_steps = total_steps
 
         if total_steps is None or total_steps <= 0:
-            # Modo indeterminado (animación continua)
-            self.progress.setRange(0, 0)
+            # Sin total conocido: icono + mensaje, sin animación
+            self.progress.setVisible(False)
+            self.icon.setVisible(True)
         else:
             # Modo determinista
+            self.icon.setVisible(False)
+            self.progress.setVisible(True)
             self.progress.setRange(0, total_steps)
             self.progress.setValue(0)
 
@@ -101,19 +113,18 @@ class LoadingIndicator(QWidget):
                 self._refresh_label()
             return
 
+        previous_step = self._current_step
         if current_step is not None:
             self._current_step = current_step
         else:
             self._current_step += step_increment
 
         # Clamp a [0, total_steps]
-        if self._current_step < 0:
-            self._current_step = 0
-        if self._current_step > self._total_steps:
-            self._current_step = self._total_steps
+        self._current_step = max(0, min(self._current_step, self._total_steps))
 
-        self.progress.setRange(0, self._total_steps)
-        self.progress.setValue(self._current_step)
+        # El rango ya lo fijó start(); solo se mueve la barra si cambió el paso
+        if self._current_step != previous_step:
+            self.progress.setValue(self._current_step)
 
         if message:
             self._base_message = message
@@ -148,11 +159,14 @@ class LoadingIndicator(QWidget):
     def _refresh_label(self):
         """
         Reconstruye el texto del label con mensaje + % si aplica.
+        Solo llama a setText si el texto cambió.
         """
         if self._total_steps and self._total_steps > 0:
             percent = int((self._current_step / self._total_steps) * 100)
-            self.label.setText(
-                f"{self._base_message} ({self._current_step}/{self._total_steps} - {percent}%)"
-            )
+            text = f"{self._base_message} ({self._current_step}/{self._total_steps} - {percent}%)"
         else:
-            self.label.setText(self._base_message)
+            text = self._base_message
+
+        if text != self._last_text:
+            self._last_text = text
+            self.label.setText(text)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from functools import partial
+
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -9,6 +11,132 @@ from PySide6.QtWidgets import (
 )
 
 
+# -------------------------------------------------
+# Opciones por modo: (título del grupo, [(clave, texto, ancho), ...]).
+# La clave es la de NoRootOptions/RootOptions; ancho=True ocupa la fila
+# entera del grupo, el resto se reparte en dos columnas.
+# -------------------------------------------------
+
+NOROOT_SPEC = [
+    ("Core (content providers)", [
+        ("contacts", "Contactos", False),
+        ("calllog", "Registro de llamadas", False),
+        ("sms", "SMS", False),
+        ("calendar", "Calendario", False),
+    ]),
+    ("Descargas / Navegador", [
+        ("downloads_list", "Listado de descargas", False),
+        ("chrome_provider", "Historial Chrome (provider)", False),
+        ("browser_provider", "Historial Browser nativo", False),
+    ]),
+    ("GPS / Red", [
+        ("gps_dumpsys", "dumpsys location (GPS)", False),
+        ("wifi_dumpsys", "dumpsys wifi", False),
+        ("net_basic", "Red básica (ip addr/route/getprop)", False),
+        ("net_connectivity", "dumpsys connectivity/telephony", False),
+    ]),
+    ("Paquetes / APKs", [
+        ("package_meta", "Meta de paquetes (pm/dumpsys)", False),
+        ("apks", "Intentar extraer APKs instaladas", False),
+    ]),
+    ("Sistema / Cuentas / Settings", [
+        ("users_accounts", "Usuarios + cuentas (dumpsys user/account)", True),
+        ("settings_system", "Settings system", False),
+        ("settings_secure", "Settings secure", False),
+        ("settings_global", "Settings global", False),
+    ]),
+    ("Procesos / Servicios en ejecución", [
+        ("running_processes", "Procesos (ps/top)", False),
+        ("running_services", "Servicios (dumpsys activity)", False),
+        ("activity_full_dump", "dumpsys activity completo (MUY pesado)", True),
+    ]),
+    ("Uso / Batería / Red", [
+        ("usage_stats", "Usage stats (usagestats)", False),
+        ("battery_stats", "Battery stats", False),
+        ("network_stats", "Net stats", False),
+    ]),
+    ("Notificaciones / Logs / Reportes", [
+        ("notifications", "Notificaciones (dumpsys/cmd notification)", True),
+        ("logcat_dump", "Logcat main/system/events", False),
+        ("logcat_radio", "Logcat radio", False),
+        ("bugreport_zip", "Bugreport ZIP (MUY pesado)", True),
+    ]),
+    ("Backups / WhatsApp / Archivos de usuario", [
+        ("adb_backup_all", "adb backup -apk -shared -all", True),
+        ("whatsapp_public", "WhatsApp público (DBs en sdcard)", False),
+        ("whatsapp_media", "Media de WhatsApp", False),
+        ("copy_device_files", "Copiar DCIM/Pictures/Movies/Download/Documents", True),
+        ("copy_sdcard_entire", "Copiar /sdcard completa (MUY pesado)", True),
+        ("list_sdcard_tree", "Sólo listado árbol /sdcard", True),
+        ("exif_inventory", "Inventario EXIF/GPS sobre media copiada", True),
+    ]),
+]
+
+ROOT_SPEC = [
+    ("Core (BD + providers)", [
+        ("contacts", "Contactos", False),
+        ("calllog", "Registro de llamadas", False),
+        ("sms", "SMS/MMS", False),
+        ("calendar", "Calendario", False),
+    ]),
+    ("Historiales / Sistema", [
+        ("gmail", "DBs Gmail", False),
+        ("chrome_history", "Chrome History + Favicons", False),
+        ("webview_history", "Historial WebView apps", False),
+        ("downloads_list", "Descargas (Downloads Provider)", False),
+    ]),
+    ("GPS / Red / Uso", [
+        ("gps_dumpsys", "dumpsys location", False),
+        ("net_location_files", "wifi/location/netstats (tar)", False),
+        ("usagestats", "usagestats (data/system/usagestats)", False),
+    ]),
+    ("Paquetes / APKs / Datos apps", [
+        ("package_meta", "Meta paquetes (packages.xml/list, pm, dumpsys)", True),
+        ("apks", "APKs instaladas (pm list packages -f)", True),
+        ("private_app_data", "Data PRIVADA apps críticas (/data/data)", True),
+        ("external_app_data", "Data EXTERNA apps críticas (/sdcard/Android/...)", True),
+    ]),
+    ("WhatsApp", [
+        ("whatsapp", "WhatsApp (DBs internas + key + backups)", True),
+        ("whatsapp_media", "Media de WhatsApp", True),
+    ]),
+    ("Archivos de usuario / EXIF", [
+        ("copy_device_files", "Copiar DCIM/Pictures/Movies/Download/Documents", True),
+        ("copy_sdcard_entire", "Copiar /sdcard completa (MUY pesado)", True),
+        ("exif_inventory", "Inventario EXIF/GPS sobre media copiada", True),
+    ]),
+    ("Imagen de partición userdata (dd)", [
+        ("userdata_image", "Crear imagen userdata.img (dd via exec-out)", True),
+    ]),
+]
+
+# Presets por perfil: claves marcadas (el resto se desmarca).
+# "completo" no aparece: marca todas.
+NOROOT_PRESETS = {
+    # Core + algo de contexto básico
+    "rapido": {
+        "contacts", "calllog", "sms", "calendar", "downloads_list",
+        "gps_dumpsys", "wifi_dumpsys", "net_basic", "package_meta",
+        "whatsapp_public", "whatsapp_media", "exif_inventory",
+    },
+    "whatsapp_media": {
+        "whatsapp_public", "whatsapp_media", "copy_device_files", "exif_inventory",
+    },
+}
+
+ROOT_PRESETS = {
+    # Core + hist básicos + WA
+    "rapido": {
+        "contacts", "calllog", "sms", "calendar", "gmail", "chrome_history",
+        "downloads_list", "gps_dumpsys", "package_meta", "apks",
+        "whatsapp", "whatsapp_media", "exif_inventory",
+    },
+    "whatsapp_media": {
+        "whatsapp", "whatsapp_media", "copy_device_files", "exif_inventory",
+    },
+}
+
+
 class ModeSelector(QWidget):
     """
     Selector compacto de:
@@ -23,15 +151,30 @@ class ModeSelector(QWidget):
     modeChanged = Signal(str)     # "NOROOT" o "ROOT"
     profileChanged = Signal(str)  # "rapido", "completo", "whatsapp_media"
     formatChanged = Signal(str)   # "L" o "C"
+    # get_settings() + "changed": {"mode": bool, "profile": bool, "format": bool}
+    # (qué campos escalares cambiaron respecto a la emisión anterior)
     settingsChanged = Signal(dict)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("ModeSelector")
 
-        self._noroot_checkboxes = []
-        self._root_checkboxes = []
-        self._all_checkboxes = []
+        # clave (NOROOT_SPEC / ROOT_SPEC) -> QCheckBox
+        self._nr_cbs: dict[str, QCheckBox] = {}
+        self._r_cbs: dict[str, QCheckBox] = {}
+
+        # Estado de las opciones por clave, al día con cada toggled (así
+        # get_settings no consulta los ~55 checkboxes). Todas empiezan
+        # desmarcadas, también las de la página Root aún sin construir.
+        self._nr_opts = {key: False for _, items in NOROOT_SPEC for key, _, _ in items}
+        self._r_opts = {key: False for _, items in ROOT_SPEC for key, _, _ in items}
+
+        # True mientras se aplica un preset: los toggled de cada checkbox no
+        # emiten; quien aplica el preset llama a _emit_all() una vez al final.
+        self._bulk = False
+
+        # Últimos valores emitidos: _emit_all solo emite lo que cambió
+        self._last = {"mode": None, "profile": None, "format": None, "settings": None}
 
         main = QVBoxLayout(self)
         main.setContentsMargins(8, 8, 8, 8)
@@ -93,18 +236,17 @@ class ModeSelector(QWidget):
         main.addStretch()
 
         # Construir páginas de opciones
+        # La de Root se crea la primera vez que se elige ese modo
+        # (_update_mode_ui); hasta entonces ocupa su índice un QWidget vacío.
         self._build_noroot_page()
-        self._build_root_page()
+        self.stack_modes.addWidget(QWidget())
+        self._root_built = False
 
         # Señales
         self.cbo_mode.currentIndexChanged.connect(self._on_mode_changed)
         self.cbo_profile.currentIndexChanged.connect(self._on_profile_changed)
-        self.btn_fmt_L.toggled.connect(self._emit_all)
-        self.btn_fmt_C.toggled.connect(self._emit_all)
-
-        # Todas las checkboxes actualizan settings
-        for cb in self._all_checkboxes:
-            cb.toggled.connect(self._emit_all)
+        # Un clic cambia los dos radios; solo cuenta el que queda marcado
+        self.group_fmt.buttonToggled.connect(self._on_format_toggled)
 
         # Estado inicial
         self._update_mode_ui()
@@ -117,337 +259,69 @@ class ModeSelector(QWidget):
 
     def _build_noroot_page(self):
         """Página de opciones para No-Root (NoRootOptions)."""
-        container = QWidget()
-        lay = QVBoxLayout(container)
-        lay.setContentsMargins(4, 4, 4, 4)
-        lay.setSpacing(4)
-
-        # --- Core providers ---
-        gb_core = QGroupBox("Core (content providers)")
-        grid_core = QGridLayout(gb_core)
-
-        self.chk_nr_contacts = QCheckBox("Contactos")
-        self.chk_nr_calllog = QCheckBox("Registro de llamadas")
-        self.chk_nr_sms = QCheckBox("SMS")
-        self.chk_nr_calendar = QCheckBox("Calendario")
-
-        grid_core.addWidget(self.chk_nr_contacts, 0, 0)
-        grid_core.addWidget(self.chk_nr_calllog, 0, 1)
-        grid_core.addWidget(self.chk_nr_sms, 1, 0)
-        grid_core.addWidget(self.chk_nr_calendar, 1, 1)
-
-        lay.addWidget(gb_core)
-
-        # --- Descargas / Navegador ---
-        gb_down = QGroupBox("Descargas / Navegador")
-        grid_down = QGridLayout(gb_down)
-
-        self.chk_nr_downloads_list = QCheckBox("Listado de descargas")
-        self.chk_nr_chrome_provider = QCheckBox("Historial Chrome (provider)")
-        self.chk_nr_browser_provider = QCheckBox("Historial Browser nativo")
-
-        grid_down.addWidget(self.chk_nr_downloads_list, 0, 0)
-        grid_down.addWidget(self.chk_nr_chrome_provider, 0, 1)
-        grid_down.addWidget(self.chk_nr_browser_provider, 1, 0)
-
-        lay.addWidget(gb_down)
-
-        # --- GPS / Red ---
-        gb_gps = QGroupBox("GPS / Red")
-        grid_gps = QGridLayout(gb_gps)
-
-        self.chk_nr_gps_dumpsys = QCheckBox("dumpsys location (GPS)")
-        self.chk_nr_wifi_dumpsys = QCheckBox("dumpsys wifi")
-        self.chk_nr_net_basic = QCheckBox("Red básica (ip addr/route/getprop)")
-        self.chk_nr_net_connectivity = QCheckBox("dumpsys connectivity/telephony")
-
-        grid_gps.addWidget(self.chk_nr_gps_dumpsys, 0, 0)
-        grid_gps.addWidget(self.chk_nr_wifi_dumpsys, 0, 1)
-        grid_gps.addWidget(self.chk_nr_net_basic, 1, 0)
-        grid_gps.addWidget(self.chk_nr_net_connectivity, 1, 1)
-
-        lay.addWidget(gb_gps)
-
-        # --- Apps / Paquetes ---
-        gb_pkg = QGroupBox("Paquetes / APKs")
-        grid_pkg = QGridLayout(gb_pkg)
-
-        self.chk_nr_package_meta = QCheckBox("Meta de paquetes (pm/dumpsys)")
-        self.chk_nr_apks = QCheckBox("Intentar extraer APKs instaladas")
-
-        grid_pkg.addWidget(self.chk_nr_package_meta, 0, 0)
-        grid_pkg.addWidget(self.chk_nr_apks, 0, 1)
-
-        lay.addWidget(gb_pkg)
-
-        # --- Sistema / Cuentas / Settings ---
-        gb_sys = QGroupBox("Sistema / Cuentas / Settings")
-        grid_sys = QGridLayout(gb_sys)
-
-        self.chk_nr_users_accounts = QCheckBox("Usuarios + cuentas (dumpsys user/account)")
-        self.chk_nr_settings_system = QCheckBox("Settings system")
-        self.chk_nr_settings_secure = QCheckBox("Settings secure")
-        self.chk_nr_settings_global = QCheckBox("Settings global")
-
-        grid_sys.addWidget(self.chk_nr_users_accounts, 0, 0, 1, 2)
-        grid_sys.addWidget(self.chk_nr_settings_system, 1, 0)
-        grid_sys.addWidget(self.chk_nr_settings_secure, 1, 1)
-        grid_sys.addWidget(self.chk_nr_settings_global, 2, 0)
-
-        lay.addWidget(gb_sys)
-
-        # --- Procesos / Servicios ---
-        gb_proc = QGroupBox("Procesos / Servicios en ejecución")
-        grid_proc = QGridLayout(gb_proc)
-
-        self.chk_nr_running_processes = QCheckBox("Procesos (ps/top)")
-        self.chk_nr_running_services = QCheckBox("Servicios (dumpsys activity)")
-        self.chk_nr_activity_full_dump = QCheckBox("dumpsys activity completo (MUY pesado)")
-
-        grid_proc.addWidget(self.chk_nr_running_processes, 0, 0)
-        grid_proc.addWidget(self.chk_nr_running_services, 0, 1)
-        grid_proc.addWidget(self.chk_nr_activity_full_dump, 1, 0, 1, 2)
-
-        lay.addWidget(gb_proc)
-
-        # --- Uso / Batería / Red ---
-        gb_usage = QGroupBox("Uso / Batería / Red")
-        grid_usage = QGridLayout(gb_usage)
-
-        self.chk_nr_usage_stats = QCheckBox("Usage stats (usagestats)")
-        self.chk_nr_battery_stats = QCheckBox("Battery stats")
-        self.chk_nr_network_stats = QCheckBox("Net stats")
-
-        grid_usage.addWidget(self.chk_nr_usage_stats, 0, 0)
-        grid_usage.addWidget(self.chk_nr_battery_stats, 0, 1)
-        grid_usage.addWidget(self.chk_nr_network_stats, 1, 0)
-
-        lay.addWidget(gb_usage)
-
-        # --- Notificaciones / Logs ---
-        gb_notif = QGroupBox("Notificaciones / Logs / Reportes")
-        grid_notif = QGridLayout(gb_notif)
-
-        self.chk_nr_notifications = QCheckBox("Notificaciones (dumpsys/cmd notification)")
-        self.chk_nr_logcat_dump = QCheckBox("Logcat main/system/events")
-        self.chk_nr_logcat_radio = QCheckBox("Logcat radio")
-        self.chk_nr_bugreport_zip = QCheckBox("Bugreport ZIP (MUY pesado)")
-
-        grid_notif.addWidget(self.chk_nr_notifications, 0, 0, 1, 2)
-        grid_notif.addWidget(self.chk_nr_logcat_dump, 1, 0)
-        grid_notif.addWidget(self.chk_nr_logcat_radio, 1, 1)
-        grid_notif.addWidget(self.chk_nr_bugreport_zip, 2, 0, 1, 2)
-
-        lay.addWidget(gb_notif)
-
-        # --- Backups / WhatsApp / Archivos usuario ---
-        gb_extra = QGroupBox("Backups / WhatsApp / Archivos de usuario")
-        grid_extra = QGridLayout(gb_extra)
-
-        self.chk_nr_adb_backup_all = QCheckBox("adb backup -apk -shared -all")
-        self.chk_nr_whatsapp_public = QCheckBox("WhatsApp público (DBs en sdcard)")
-        self.chk_nr_whatsapp_media = QCheckBox("Media de WhatsApp")
-        self.chk_nr_copy_device_files = QCheckBox("Copiar DCIM/Pictures/Movies/Download/Documents")
-        self.chk_nr_copy_sdcard_entire = QCheckBox("Copiar /sdcard completa (MUY pesado)")
-        self.chk_nr_list_sdcard_tree = QCheckBox("Sólo listado árbol /sdcard")
-        self.chk_nr_exif_inventory = QCheckBox("Inventario EXIF/GPS sobre media copiada")
-
-        grid_extra.addWidget(self.chk_nr_adb_backup_all, 0, 0, 1, 2)
-        grid_extra.addWidget(self.chk_nr_whatsapp_public, 1, 0)
-        grid_extra.addWidget(self.chk_nr_whatsapp_media, 1, 1)
-        grid_extra.addWidget(self.chk_nr_copy_device_files, 2, 0, 1, 2)
-        grid_extra.addWidget(self.chk_nr_copy_sdcard_entire, 3, 0, 1, 2)
-        grid_extra.addWidget(self.chk_nr_list_sdcard_tree, 4, 0, 1, 2)
-        grid_extra.addWidget(self.chk_nr_exif_inventory, 5, 0, 1, 2)
-
-        lay.addWidget(gb_extra)
-
-        lay.addStretch()
-
-        # Scroll para no matar la ventana si se hace pequeña
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setWidget(container)
-
-        self.stack_modes.addWidget(scroll)
-
-        # Registrar checkboxes No-Root
-        self._noroot_checkboxes = [
-            self.chk_nr_contacts,
-            self.chk_nr_calllog,
-            self.chk_nr_sms,
-            self.chk_nr_calendar,
-            self.chk_nr_downloads_list,
-            self.chk_nr_chrome_provider,
-            self.chk_nr_browser_provider,
-            self.chk_nr_gps_dumpsys,
-            self.chk_nr_wifi_dumpsys,
-            self.chk_nr_net_basic,
-            self.chk_nr_net_connectivity,
-            self.chk_nr_package_meta,
-            self.chk_nr_apks,
-            self.chk_nr_users_accounts,
-            self.chk_nr_settings_system,
-            self.chk_nr_settings_secure,
-            self.chk_nr_settings_global,
-            self.chk_nr_running_processes,
-            self.chk_nr_running_services,
-            self.chk_nr_activity_full_dump,
-            self.chk_nr_usage_stats,
-            self.chk_nr_battery_stats,
-            self.chk_nr_network_stats,
-            self.chk_nr_notifications,
-            self.chk_nr_logcat_dump,
-            self.chk_nr_logcat_radio,
-            self.chk_nr_bugreport_zip,
-            self.chk_nr_adb_backup_all,
-            self.chk_nr_whatsapp_public,
-            self.chk_nr_whatsapp_media,
-            self.chk_nr_copy_device_files,
-            self.chk_nr_copy_sdcard_entire,
-            self.chk_nr_list_sdcard_tree,
-            self.chk_nr_exif_inventory,
-        ]
-        self._all_checkboxes.extend(self._noroot_checkboxes)
+        self.stack_modes.addWidget(self._build_options_page(NOROOT_SPEC, self._nr_cbs, self._nr_opts))
 
     def _build_root_page(self):
-        """Página de opciones para Root (RootOptions)."""
+        """Página de opciones para Root (RootOptions), sustituye al hueco del índice 1."""
+        placeholder = self.stack_modes.widget(1)
+        self.stack_modes.insertWidget(1, self._build_options_page(ROOT_SPEC, self._r_cbs, self._r_opts))
+        self.stack_modes.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._root_built = True
+
+    def _build_options_page(self, spec, checkboxes: dict, opts: dict) -> QScrollArea:
+        """
+        Coloca todas las opciones de 'spec' en un único QGridLayout: el
+        título de cada grupo en su propia fila y debajo sus checkboxes (dos
+        por fila; las de ancho=True, en fila propia). Un solo layout por
+        página en vez de un QGroupBox + QGridLayout por grupo.
+        Registra los checkboxes en 'checkboxes' por clave y en un
+        QButtonGroup no exclusivo (id = posición en 'keys'): una sola
+        conexión por página actualiza la clave tocada en 'opts'.
+        """
         container = QWidget()
-        lay = QVBoxLayout(container)
-        lay.setContentsMargins(4, 4, 4, 4)
-        lay.setSpacing(4)
-
-        # --- Core ---
-        gb_core = QGroupBox("Core (BD + providers)")
-        grid_core = QGridLayout(gb_core)
-
-        self.chk_r_contacts = QCheckBox("Contactos")
-        self.chk_r_calllog = QCheckBox("Registro de llamadas")
-        self.chk_r_sms = QCheckBox("SMS/MMS")
-        self.chk_r_calendar = QCheckBox("Calendario")
-
-        grid_core.addWidget(self.chk_r_contacts, 0, 0)
-        grid_core.addWidget(self.chk_r_calllog, 0, 1)
-        grid_core.addWidget(self.chk_r_sms, 1, 0)
-        grid_core.addWidget(self.chk_r_calendar, 1, 1)
-
-        lay.addWidget(gb_core)
-
-        # --- Historiales / Sistema ---
-        gb_hist = QGroupBox("Historiales / Sistema")
-        grid_hist = QGridLayout(gb_hist)
-
-        self.chk_r_gmail = QCheckBox("DBs Gmail")
-        self.chk_r_chrome_history = QCheckBox("Chrome History + Favicons")
-        self.chk_r_webview_history = QCheckBox("Historial WebView apps")
-        self.chk_r_downloads_list = QCheckBox("Descargas (Downloads Provider)")
-
-        grid_hist.addWidget(self.chk_r_gmail, 0, 0)
-        grid_hist.addWidget(self.chk_r_chrome_history, 0, 1)
-        grid_hist.addWidget(self.chk_r_webview_history, 1, 0)
-        grid_hist.addWidget(self.chk_r_downloads_list, 1, 1)
-
-        lay.addWidget(gb_hist)
-
-        # --- GPS / Red / Uso ---
-        gb_gps = QGroupBox("GPS / Red / Uso")
-        grid_gps = QGridLayout(gb_gps)
-
-        self.chk_r_gps_dumpsys = QCheckBox("dumpsys location")
-        self.chk_r_net_location_files = QCheckBox("wifi/location/netstats (tar)")
-        self.chk_r_usagestats = QCheckBox("usagestats (data/system/usagestats)")
-
-        grid_gps.addWidget(self.chk_r_gps_dumpsys, 0, 0)
-        grid_gps.addWidget(self.chk_r_net_location_files, 0, 1)
-        grid_gps.addWidget(self.chk_r_usagestats, 1, 0)
-
-        lay.addWidget(gb_gps)
-
-        # --- Paquetes / APKs / Data apps ---
-        gb_pkg = QGroupBox("Paquetes / APKs / Datos apps")
-        grid_pkg = QGridLayout(gb_pkg)
-
-        self.chk_r_package_meta = QCheckBox("Meta paquetes (packages.xml/list, pm, dumpsys)")
-        self.chk_r_apks = QCheckBox("APKs instaladas (pm list packages -f)")
-        self.chk_r_private_app_data = QCheckBox("Data PRIVADA apps críticas (/data/data)")
-        self.chk_r_external_app_data = QCheckBox("Data EXTERNA apps críticas (/sdcard/Android/...)")
-
-        grid_pkg.addWidget(self.chk_r_package_meta, 0, 0, 1, 2)
-        grid_pkg.addWidget(self.chk_r_apks, 1, 0, 1, 2)
-        grid_pkg.addWidget(self.chk_r_private_app_data, 2, 0, 1, 2)
-        grid_pkg.addWidget(self.chk_r_external_app_data, 3, 0, 1, 2)
-
-        lay.addWidget(gb_pkg)
-
-        # --- WhatsApp ---
-        gb_wa = QGroupBox("WhatsApp")
-        grid_wa = QGridLayout(gb_wa)
-
-        self.chk_r_whatsapp = QCheckBox("WhatsApp (DBs internas + key + backups)")
-        self.chk_r_whatsapp_media = QCheckBox("Media de WhatsApp")
-
-        grid_wa.addWidget(self.chk_r_whatsapp, 0, 0, 1, 2)
-        grid_wa.addWidget(self.chk_r_whatsapp_media, 1, 0, 1, 2)
-
-        lay.addWidget(gb_wa)
-
-        # --- Archivos usuario / EXIF ---
-        gb_media = QGroupBox("Archivos de usuario / EXIF")
-        grid_media = QGridLayout(gb_media)
-
-        self.chk_r_copy_device_files = QCheckBox("Copiar DCIM/Pictures/Movies/Download/Documents")
-        self.chk_r_copy_sdcard_entire = QCheckBox("Copiar /sdcard completa (MUY pesado)")
-        self.chk_r_exif_inventory = QCheckBox("Inventario EXIF/GPS sobre media copiada")
-
-        grid_media.addWidget(self.chk_r_copy_device_files, 0, 0, 1, 2)
-        grid_media.addWidget(self.chk_r_copy_sdcard_entire, 1, 0, 1, 2)
-        grid_media.addWidget(self.chk_r_exif_inventory, 2, 0, 1, 2)
-
-        lay.addWidget(gb_media)
-
-        # --- Imagen userdata ---
-        gb_img = QGroupBox("Imagen de partición userdata (dd)")
-        grid_img = QGridLayout(gb_img)
-
-        self.chk_r_userdata_image = QCheckBox("Crear imagen userdata.img (dd via exec-out)")
-
-        grid_img.addWidget(self.chk_r_userdata_image, 0, 0, 1, 2)
-
-        lay.addWidget(gb_img)
-
-        lay.addStretch()
+        # Sin repintados mientras se llena; un solo update al final
+        container.setUpdatesEnabled(False)
+        grid = QGridLayout(container)
+        grid.setContentsMargins(4, 4, 4, 4)
+        grid.setSpacing(4)
+
+        group = QButtonGroup(self)
+        group.setExclusive(False)
+        keys = []
+
+        row = 0
+        for title, items in spec:
+            header = QLabel(title)
+            header.setObjectName("OptionsGroupTitle")
+            grid.addWidget(header, row, 0, 1, 2)
+            row += 1
+            col = 0
+            for key, label, wide in items:
+                cb = QCheckBox(label)
+                group.addButton(cb, len(keys))
+                keys.append(key)
+                checkboxes[key] = cb
+                if wide:
+                    if col:
+                        row, col = row + 1, 0
+                    grid.addWidget(cb, row, 0, 1, 2)
+                    row += 1
+                else:
+                    grid.addWidget(cb, row, col)
+                    row, col = (row + 1, 0) if col else (row, 1)
+            if col:
+                row += 1
+
+        grid.setRowStretch(row, 1)  # empuja todo hacia arriba
+        group.idToggled.connect(partial(self._on_option_toggled, keys, opts))
+        container.setUpdatesEnabled(True)
 
+        # Scroll para no matar la ventana si se hace pequeña
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setWidget(container)
-
-        self.stack_modes.addWidget(scroll)
-
-        # Registrar checkboxes Root
-        self._root_checkboxes = [
-            self.chk_r_contacts,
-            self.chk_r_calllog,
-            self.chk_r_sms,
-            self.chk_r_calendar,
-            self.chk_r_gmail,
-            self.chk_r_chrome_history,
-            self.chk_r_webview_history,
-            self.chk_r_downloads_list,
-            self.chk_r_gps_dumpsys,
-            self.chk_r_net_location_files,
-            self.chk_r_usagestats,
-            self.chk_r_package_meta,
-            self.chk_r_apks,
-            self.chk_r_private_app_data,
-            self.chk_r_external_app_data,
-            self.chk_r_whatsapp,
-            self.chk_r_whatsapp_media,
-            self.chk_r_copy_device_files,
-            self.chk_r_copy_sdcard_entire,
-            self.chk_r_exif_inventory,
-            self.chk_r_userdata_image,
-        ]
-        self._all_checkboxes.extend(self._root_checkboxes)
+        return scroll
 
     # -------------------------------------------------
     # Estado actual
@@ -464,67 +338,10 @@ class ModeSelector(QWidget):
 
     # Diccionarios listos para mapear a NoRootOptions/RootOptions
     def current_noroot_options(self) -> dict:
-        return {
-            "contacts": self.chk_nr_contacts.isChecked(),
-            "calllog": self.chk_nr_calllog.isChecked(),
-            "sms": self.chk_nr_sms.isChecked(),
-            "calendar": self.chk_nr_calendar.isChecked(),
-            "downloads_list": self.chk_nr_downloads_list.isChecked(),
-            "chrome_provider": self.chk_nr_chrome_provider.isChecked(),
-            "browser_provider": self.chk_nr_browser_provider.isChecked(),
-            "gps_dumpsys": self.chk_nr_gps_dumpsys.isChecked(),
-            "wifi_dumpsys": self.chk_nr_wifi_dumpsys.isChecked(),
-            "net_basic": self.chk_nr_net_basic.isChecked(),
-            "net_connectivity": self.chk_nr_net_connectivity.isChecked(),
-            "package_meta": self.chk_nr_package_meta.isChecked(),
-            "apks": self.chk_nr_apks.isChecked(),
-            "users_accounts": self.chk_nr_users_accounts.isChecked(),
-            "settings_system": self.chk_nr_settings_system.isChecked(),
-            "settings_secure": self.chk_nr_settings_secure.isChecked(),
-            "settings_global": self.chk_nr_settings_global.isChecked(),
-            "running_processes": self.chk_nr_running_processes.isChecked(),
-            "running_services": self.chk_nr_running_services.isChecked(),
-            "activity_full_dump": self.chk_nr_activity_full_dump.isChecked(),
-            "usage_stats": self.chk_nr_usage_stats.isChecked(),
-            "battery_stats": self.chk_nr_battery_stats.isChecked(),
-            "network_stats": self.chk_nr_network_stats.isChecked(),
-            "notifications": self.chk_nr_notifications.isChecked(),
-            "logcat_dump": self.chk_nr_logcat_dump.isChecked(),
-            "logcat_radio": self.chk_nr_logcat_radio.isChecked(),
-            "bugreport_zip": self.chk_nr_bugreport_zip.isChecked(),
-            "adb_backup_all": self.chk_nr_adb_backup_all.isChecked(),
-            "whatsapp_public": self.chk_nr_whatsapp_public.isChecked(),
-            "whatsapp_media": self.chk_nr_whatsapp_media.isChecked(),
-            "copy_device_files": self.chk_nr_copy_device_files.isChecked(),
-            "copy_sdcard_entire": self.chk_nr_copy_sdcard_entire.isChecked(),
-            "list_sdcard_tree": self.chk_nr_list_sdcard_tree.isChecked(),
-            "exif_inventory": self.chk_nr_exif_inventory.isChecked(),
-        }
+        return self._nr_opts.copy()
 
     def current_root_options(self) -> dict:
-        return {
-            "contacts": self.chk_r_contacts.isChecked(),
-            "calllog": self.chk_r_calllog.isChecked(),
-            "sms": self.chk_r_sms.isChecked(),
-            "calendar": self.chk_r_calendar.isChecked(),
-            "gmail": self.chk_r_gmail.isChecked(),
-            "chrome_history": self.chk_r_chrome_history.isChecked(),
-            "webview_history": self.chk_r_webview_history.isChecked(),
-            "downloads_list": self.chk_r_downloads_list.isChecked(),
-            "gps_dumpsys": self.chk_r_gps_dumpsys.isChecked(),
-            "net_location_files": self.chk_r_net_location_files.isChecked(),
-            "usagestats": self.chk_r_usagestats.isChecked(),
-            "apks": self.chk_r_apks.isChecked(),
-            "package_meta": self.chk_r_package_meta.isChecked(),
-            "private_app_data": self.chk_r_private_app_data.isChecked(),
-            "external_app_data": self.chk_r_external_app_data.isChecked(),
-            "whatsapp": self.chk_r_whatsapp.isChecked(),
-            "whatsapp_media": self.chk_r_whatsapp_media.isChecked(),
-            "copy_device_files": self.chk_r_copy_device_files.isChecked(),
-            "copy_sdcard_entire": self.chk_r_copy_sdcard_entire.isChecked(),
-            "exif_inventory": self.chk_r_exif_inventory.isChecked(),
-            "userdata_image": self.chk_r_userdata_image.isChecked(),
-        }
+        return self._r_opts.copy()
 
     def get_settings(self) -> dict:
         return {
@@ -539,95 +356,45 @@ class ModeSelector(QWidget):
     # Internos: perfil / modo / señales
     # -------------------------------------------------
 
-    def _set_noroot_all(self, value: bool):
-        for cb in self._noroot_checkboxes:
-            cb.setChecked(value)
-
-    def _set_root_all(self, value: bool):
-        for cb in self._root_checkboxes:
-            cb.setChecked(value)
+    @staticmethod
+    def _apply_preset(checkboxes: dict, preset):
+        """Marca las claves de 'preset' y desmarca el resto (None = todas)."""
+        for key, cb in checkboxes.items():
+            cb.setChecked(preset is None or key in preset)
 
     def _apply_profile_noroot(self, profile: str):
         """
         Aplica un preset de No-Root según el perfil seleccionado.
         Siempre se puede ajustar a mano después.
         """
-        if profile == "rapido":
-            self._set_noroot_all(False)
-            # Core + algo de contexto básico
-            for cb in [
-                self.chk_nr_contacts,
-                self.chk_nr_calllog,
-                self.chk_nr_sms,
-                self.chk_nr_calendar,
-                self.chk_nr_downloads_list,
-                self.chk_nr_gps_dumpsys,
-                self.chk_nr_wifi_dumpsys,
-                self.chk_nr_net_basic,
-                self.chk_nr_package_meta,
-                self.chk_nr_whatsapp_public,
-                self.chk_nr_whatsapp_media,
-                self.chk_nr_exif_inventory,
-            ]:
-                cb.setChecked(True)
-        elif profile == "whatsapp_media":
-            self._set_noroot_all(False)
-            for cb in [
-                self.chk_nr_whatsapp_public,
-                self.chk_nr_whatsapp_media,
-                self.chk_nr_copy_device_files,
-                self.chk_nr_exif_inventory,
-            ]:
-                cb.setChecked(True)
-        else:  # completo
-            self._set_noroot_all(True)
+        self._apply_preset(self._nr_cbs, NOROOT_PRESETS.get(profile))
 
     def _apply_profile_root(self, profile: str):
         """
         Aplica un preset de Root según el perfil seleccionado.
         """
-        if profile == "rapido":
-            self._set_root_all(False)
-            # Core + hist básicos + WA
-            for cb in [
-                self.chk_r_contacts,
-                self.chk_r_calllog,
-                self.chk_r_sms,
-                self.chk_r_calendar,
-                self.chk_r_gmail,
-                self.chk_r_chrome_history,
-                self.chk_r_downloads_list,
-                self.chk_r_gps_dumpsys,
-                self.chk_r_package_meta,
-                self.chk_r_apks,
-                self.chk_r_whatsapp,
-                self.chk_r_whatsapp_media,
-                self.chk_r_exif_inventory,
-            ]:
-                cb.setChecked(True)
-        elif profile == "whatsapp_media":
-            self._set_root_all(False)
-            for cb in [
-                self.chk_r_whatsapp,
-                self.chk_r_whatsapp_media,
-                self.chk_r_copy_device_files,
-                self.chk_r_exif_inventory,
-            ]:
-                cb.setChecked(True)
-        else:  # completo
-            self._set_root_all(True)
+        self._apply_preset(self._r_cbs, ROOT_PRESETS.get(profile))
 
     def _apply_profile(self):
         mode = self.current_mode()
         profile = self.current_profile()
-        if mode == "NOROOT":
-            self._apply_profile_noroot(profile)
-        else:
-            self._apply_profile_root(profile)
+        # Un solo repintado tras marcar/desmarcar todo el preset
+        self._bulk = True
+        self.setUpdatesEnabled(False)
+        try:
+            if mode == "NOROOT":
+                self._apply_profile_noroot(profile)
+            else:
+                self._apply_profile_root(profile)
+        finally:
+            self.setUpdatesEnabled(True)
+            self._bulk = False
 
     def _update_mode_ui(self):
         mode = self.current_mode()
         idx = 0 if mode == "NOROOT" else 1
+        if idx == 1 and not self._root_built:
+            self._build_root_page()
         self.stack_modes.setCurrentIndex(idx)
 
     def _on_mode_changed(self, index: int):
@@ -639,12 +406,33 @@ class ModeSelector(QWidget):
         self._apply_profile()
         self._emit_all()
 
-    def _emit_all(self):
-        mode = self.current_mode()
-        profile = self.current_profile()
-        fmt = self.current_format()
+    def _on_option_toggled(self, keys: list, opts: dict, button_id: int, checked: bool):
+        opts[keys[button_id]] = checked
+        self._emit_all()
 
-        self.modeChanged.emit(mode)
-        self.profileChanged.emit(profile)
-        self.formatChanged.emit(fmt)
-        self.settingsChanged.emit(self.get_settings())
+    def _on_format_toggled(self, button, checked: bool):
+        if checked:
+            self._emit_all()
+
+    def _emit_all(self):
+        if self._bulk:
+            return
+
+        last = self._last
+        settings = self.get_settings()
+        if settings == last["settings"]:
+            return
+
+        changed = {f: settings[f] != last[f] for f in ("mode", "profile", "format")}
+        last["settings"] = settings
+        for f in ("mode", "profile", "format"):
+            last[f] = settings[f]
+
+        # Una sola señal compuesta; las escalares, solo si cambió su campo
+        self.settingsChanged.emit({**settings, "changed": changed})
+        if changed["mode"]:
+            self.modeChanged.emit(settings["mode"])
+        if changed["profile"]:
+            self.profileChanged.emit(settings["profile"])
+        if changed["format"]:
+            self.formatChanged.emit(settings["format"])
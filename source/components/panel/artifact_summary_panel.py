@@ -16,20 +16,13 @@ class _SummaryCard(QFrame):
         super().__init__(parent)
         self.setObjectName("SummaryCard")
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame#SummaryCard {
-                border: 1px solid #333;
-                border-radius: 6px;
-                background-color: #111827;
-            }
-        """)
         lay = QVBoxLayout(self)
         lay.setContentsMargins(8, 6, 8, 6)
 
         self.lbl_title = QLabel(title)
-        self.lbl_title.setStyleSheet("font-size: 11px; color: #9ca3af;")
+        self.lbl_title.setObjectName("SummaryCardTitle")
         self.lbl_value = QLabel("0")
-        self.lbl_value.setStyleSheet("font-size: 20px; font-weight: 600; color: #22c55e;")
+        self.lbl_value.setObjectName("SummaryCardValue")
 
         lay.addWidget(self.lbl_title)
         lay.addWidget(self.lbl_value)
@@ -28,7 +28,7 @@ class LogPanel(QWidget):
 
         header = QHBoxLayout()
         lbl = QLabel("Registro de ejecución")
-        lbl.setStyleSheet("font-weight: 600;")
+        lbl.setObjectName("SectionTitle")
         header.addWidget(lbl)
 
         header.addStretch()
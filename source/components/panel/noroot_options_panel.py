@@ -134,7 +134,7 @@ class NoRootOptionsPanel(QWidget):
         lay_wa.addWidget(self.chk_exif_inventory)
 
         lbl_info = QLabel("Consejo: activar EXIF solo si copias archivos del dispositivo.")
-        lbl_info.setStyleSheet("color: #888; font-size: 11px;")
+        lbl_info.setObjectName("HintLabel")
         lay_wa.addWidget(lbl_info)
 
         # ====== GRID de 2 columnas ======
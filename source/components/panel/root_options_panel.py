@@ -126,7 +126,7 @@ class RootOptionsPanel(QWidget):
             lay_wa.addWidget(chk)
 
         lbl_wa_info = QLabel("Nota: EXIF solo tiene sentido si copias multimedia del dispositivo.")
-        lbl_wa_info.setStyleSheet("color: #888; font-size: 11px;")
+        lbl_wa_info.setObjectName("HintLabel")
         lay_wa.addWidget(lbl_wa_info)
 
         # --- Imagen dd /userdata ---
@@ -144,7 +144,7 @@ class RootOptionsPanel(QWidget):
         lay_img.addLayout(row_blk)
 
         lbl_img_warn = QLabel("ADVERTENCIA: archivo enorme. Asegúrate de tener espacio en el PC.")
-        lbl_img_warn.setStyleSheet("color: #ff8800; font-size: 11px;")
+        lbl_img_warn.setObjectName("WarningLabel")
         lay_img.addWidget(lbl_img_warn)
 
         # ====== GRID de 2 columnas ======
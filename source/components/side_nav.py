@@ -1,9 +1,14 @@
 # source/Components/side_nav.py
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QRect, QEasingCurve
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QVariantAnimation, QRect, QEasingCurve, QAbstractAnimation, QSignalBlocker,
+    QTimer,
+)
 from PySide6.QtWidgets import (
-    QFrame, QVBoxLayout, QPushButton, QSizePolicy
+    QFrame, QVBoxLayout, QPushButton, QSizePolicy, QButtonGroup
 )
 
+from theme.theme_dark import NAV_STYLESHEET
+
 
 class SideNav(QFrame):
     currentIndexChanged = Signal(int)
@@ -11,14 +16,30 @@ class SideNav(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("NavFrame")
+        self.setStyleSheet(NAV_STYLESHEET)
         self.setFixedWidth(210)
 
         self._buttons = []
+        # Geometría destino del indicador por botón; se recalcula solo al
+        # redimensionar, no en cada clic (btn.y() fuerza el layout).
+        self._rects: list[QRect] = []
+        self._current_index = -1  # ninguno hasta el setCurrentIndex inicial
+
+        # Clics seguidos se agrupan: solo se aplica el último índice en la
+        # siguiente vuelta del event loop (una animación en vez de N).
+        self._pending_index = 0
+        self._nav_debounce = QTimer(self)
+        self._nav_debounce.setSingleShot(True)
+        self._nav_debounce.setInterval(0)
+        self._nav_debounce.timeout.connect(self._apply_pending_index)
         self._indicator = QFrame(self)
-        self._indicator.setStyleSheet("background-color: #22c55e; border-radius: 3px;")
+        self._indicator.setObjectName("NavIndicator")
         self._indicator.setGeometry(4, 40, 4, 36)
 
-        self._anim = QPropertyAnimation(self._indicator, b"geometry", self)
+        # QVariantAnimation escribe la geometría directamente en cada frame,
+        # sin resolver la propiedad "geometry" por el sistema de meta-objetos.
+        self._anim = QVariantAnimation(self)
+        self._anim.valueChanged.connect(self._indicator.setGeometry)
         self._anim.setDuration(250)
         self._anim.setEasingCurve(QEasingCurve.OutCubic)
 
@@ -35,17 +56,22 @@ class SideNav(QFrame):
 
         layout.addSpacing(8)
 
+        # Un solo grupo exclusivo y una sola conexión para todos los botones
+        self._group = QButtonGroup(self)
+        self._group.setExclusive(True)
+
         for text, index in sections:
             btn = QPushButton(text, self)
             btn.setObjectName("NavButton")
             btn.setCheckable(True)
             btn.setCursor(Qt.PointingHandCursor)
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            btn.clicked.connect(lambda checked, i=index: self.setCurrentIndex(i))
+            self._group.addButton(btn, index)
             layout.addWidget(btn)
             self._buttons.append(btn)
 
         layout.addStretch()
+        self._group.idClicked.connect(self._queue_index)
 
         # Estado inicial
         self.setCurrentIndex(0, animate=False)
@@ -53,19 +79,22 @@ class SideNav(QFrame):
     def setCurrentIndex(self, index: int, animate: bool = True):
         if index < 0 or index >= len(self._buttons):
             return
+        if index == self._current_index:  # misma sección: nada que animar
+            return
 
-        for i, btn in enumerate(self._buttons):
-            btn.setChecked(i == index)
+        # El grupo exclusivo desmarca el anterior; sin señales del botón
+        btn = self._group.button(index)
+        blocker = QSignalBlocker(btn)
+        btn.setChecked(True)
+        blocker.unblock()
 
-        btn = self._buttons[index]
-        target_rect = QRect(
-            4,
-            btn.y(),
-            self._indicator.width(),
-            btn.height(),
-        )
+        self._current_index = index
+        if not self._rects:
+            self._cache_rects()
+        target_rect = self._rects[index]
 
-        if not animate:
+        if not animate or not self.isVisible():
+            self._anim.stop()
             self._indicator.setGeometry(target_rect)
         else:
             self._anim.stop()
@@ -74,3 +103,23 @@ class SideNav(QFrame):
             self._anim.start()
 
         self.currentIndexChanged.emit(index)
+
+    @Slot(int)
+    def _queue_index(self, index: int):
+        self._pending_index = index
+        self._nav_debounce.start()
+
+    @Slot()
+    def _apply_pending_index(self):
+        self.setCurrentIndex(self._pending_index)
+
+    def _cache_rects(self):
+        w = self._indicator.width()
+        self._rects = [QRect(4, b.y(), w, b.height()) for b in self._buttons]
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # El layout ya colocó los botones: nuevas posiciones del indicador
+        self._cache_rects()
+        if self._current_index >= 0 and self._anim.state() != QAbstractAnimation.Running:
+            self._indicator.setGeometry(self._rects[self._current_index])
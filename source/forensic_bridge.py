@@ -153,8 +153,7 @@ def run_forensic_from_cfg(
     analyzer.case_name = cfg.get("case_name") or "caso"
     analyzer.case_dir = base_dir / "casos" / analyzer.case_name
     analyzer.logs_dir = analyzer.case_dir / "logs"
-    analyzer.case_dir.mkdir(parents=True, exist_ok=True)
-    analyzer.logs_dir.mkdir(parents=True, exist_ok=True)
+    analyzer.logs_dir.mkdir(parents=True, exist_ok=True)  # crea también case_dir
 
     analyzer.format_mode = cfg.get("format_mode", "L")  # "L" o "C"
     analyzer.mode_root = bool(cfg.get("mode_root", False))
@@ -1,3 +1,3 @@
-from .theme_dark import DARK_STYLESHEET
+from .theme_dark import DARK_STYLESHEET, NAV_STYLESHEET
 
-__all__ = ["DARK_STYLESHEET"]
+__all__ = ["DARK_STYLESHEET", "NAV_STYLESHEET"]
@@ -11,9 +11,6 @@ QWidget {
     background-color: #121212;
     color: #f5f5f5;
 }
-QFrame#NavFrame {
-    background-color: #0d0d0d;
-}
 QPushButton {
     background-color: #1f1f1f;
     border: 1px solid #333333;
@@ -27,19 +24,6 @@ QPushButton:hover {
 QPushButton:pressed {
     background-color: #0f766e;
 }
-QPushButton#NavButton {
-    background-color: transparent;
-    border: none;
-    padding: 8px 12px;
-    text-align: left;
-}
-QPushButton#NavButton:hover {
-    background-color: #1f2937;
-}
-QPushButton#NavButton:checked {
-    background-color: #0f172a;
-    color: #22c55e;
-}
 QLineEdit, QComboBox {
     background-color: #1e1e1e;
     border: 1px solid #333333;
@@ -66,6 +50,43 @@ QLabel#SubtitleLabel {
     font-size: 11pt;
     color: #9ca3af;
 }
+QLabel#HeaderTitle {
+    font-size: 16px;
+    font-weight: 600;
+}
+QLabel#HeaderDevice {
+    color: #bbbbbb;
+}
+QLabel#SectionTitle {
+    font-weight: 600;
+}
+QLabel#OptionsGroupTitle {
+    color: #9ca3af;
+    padding-top: 8px;
+    border-bottom: 1px solid #2a2a2a;
+}
+QLabel#HintLabel {
+    color: #888;
+    font-size: 11px;
+}
+QLabel#WarningLabel {
+    color: #ff8800;
+    font-size: 11px;
+}
+QFrame#SummaryCard {
+    border: 1px solid #333;
+    border-radius: 6px;
+    background-color: #111827;
+}
+QLabel#SummaryCardTitle {
+    font-size: 11px;
+    color: #9ca3af;
+}
+QLabel#SummaryCardValue {
+    font-size: 20px;
+    font-weight: 600;
+    color: #22c55e;
+}
 QStatusBar {
     background-color: #0b0b0b;
 }
@@ -89,3 +110,28 @@ QProgressBar::chunk {
 }
 
 """
+
+# Reglas de la barra lateral: SideNav las aplica sobre su propio frame, así
+# no forman parte de la hoja global que Qt resuelve para cada widget.
+NAV_STYLESHEET = """
+QFrame#NavFrame {
+    background-color: #0d0d0d;
+}
+QPushButton#NavButton {
+    background-color: transparent;
+    border: none;
+    padding: 8px 12px;
+    text-align: left;
+}
+QPushButton#NavButton:hover {
+    background-color: #1f2937;
+}
+QPushButton#NavButton:checked {
+    background-color: #0f172a;
+    color: #22c55e;
+}
+QFrame#NavIndicator {
+    background-color: #22c55e;
+    border-radius: 3px;
+}
+"""
@@ -1,7 +1,18 @@
 # source/view/__init__.py
-from .home_view import HomeView
-from .analysis_view import AnalysisView
-from .export_view import ExportView
-from .settings_view import SettingsView
+# Imports perezosos (PEP 562): cada vista se carga la primera vez que se pide.
+from importlib import import_module
 
-__all__ = ["HomeView", "AnalysisView", "ExportView", "SettingsView"]
+_EXPORTS = {
+    "HomeView": ".home_view",
+    "AnalysisView": ".analysis_view",
+    "ExportView": ".export_view",
+    "SettingsView": ".settings_view",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
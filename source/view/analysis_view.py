@@ -5,7 +5,7 @@ from pathlib import Path
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QLabel, QPushButton, QPlainTextEdit, QProgressBar,
+    QLabel, QPushButton, QPlainTextEdit,
     QSizePolicy
 )
 
@@ -18,7 +18,7 @@ class AnalysisView(QWidget):
     - Configuración de adquisición (ModeSelector)
     - Log de ejecución auto-ajustable
     - Botones claros abajo
-    - Animación de carga (QProgressBar indeterminada)
+    - Indicador de ocupado (icono fijo, sin animación)
     """
 
     runAnalysisRequested = Signal(dict)   # settings del ModeSelector
@@ -32,7 +32,9 @@ class AnalysisView(QWidget):
         main.setSpacing(12)
 
         # --- Título ---
-        title = QLabel("<b>Análisis del dispositivo</b>")
+        title = QLabel("Análisis del dispositivo")
+        title.setTextFormat(Qt.PlainText)
+        title.setObjectName("SectionTitle")
         title.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         main.addWidget(title)
 
@@ -63,19 +65,18 @@ class AnalysisView(QWidget):
         bottom_bar = QHBoxLayout()
         bottom_bar.setSpacing(8)
 
-        # Animación de carga: barra indeterminada
-        self.progress = QProgressBar(self)
-        self.progress.setRange(0, 0)       # indeterminado
-        self.progress.setTextVisible(False)
-        self.progress.setFixedHeight(10)
-        self.progress.setVisible(False)
+        # Indicador de ocupado: icono fijo, como LoadingIndicator. Una barra
+        # indeterminada repintaría cada ~30 ms durante todo el análisis.
+        self.icon_busy = QLabel("⏳")
+        self.icon_busy.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self.icon_busy.setVisible(False)
 
         self.lbl_status = QLabel("Listo.")
         self.lbl_status.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
-        bottom_left = QVBoxLayout()
+        bottom_left = QHBoxLayout()
+        bottom_left.addWidget(self.icon_busy)
         bottom_left.addWidget(self.lbl_status)
-        bottom_left.addWidget(self.progress)
 
         bottom_bar.addLayout(bottom_left)
         bottom_bar.addStretch()
@@ -114,12 +115,12 @@ class AnalysisView(QWidget):
         """
         Cambia la UI a modo ocupado/libre:
         - Deshabilita controles mientras corre
-        - Muestra/oculta la animación de carga
+        - Muestra/oculta el icono de ocupado
         """
         self.mode_selector.setEnabled(not busy)
         self.btn_run.setEnabled(not busy)
         self.btn_cancel.setEnabled(busy)
-        self.progress.setVisible(busy)
+        self.icon_busy.setVisible(busy)
 
         if message is not None:
             self.lbl_status.setText(message)
@@ -13,7 +13,9 @@ class ExportView(QWidget):
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
 
-        title = QLabel("<b>Exportación de resultados</b>")
+        title = QLabel("Exportación de resultados")
+        title.setTextFormat(Qt.PlainText)
+        title.setObjectName("SectionTitle")
         title.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         layout.addWidget(title)
 
@@ -22,12 +24,13 @@ class ExportView(QWidget):
         box_layout.setContentsMargins(12, 12, 12, 12)
 
         info = QLabel(
-            "Cuando ejecutas el análisis desde la pestaña <b>Análisis</b>, "
+            "Cuando ejecutas el análisis desde la pestaña Análisis, "
             "ya se generan los CSV legibles y, si lo configuras así, "
-            "también el archivo de Excel.<br><br>"
+            "también el archivo de Excel.\n\n"
             "Esta sección es solo para re-exportar manualmente casos ya analizados "
-            "usando el modo <b>CLI</b>."
+            "usando el modo CLI."
         )
+        info.setTextFormat(Qt.PlainText)
         info.setWordWrap(True)
         box_layout.addWidget(info)
 
@@ -38,9 +41,10 @@ class ExportView(QWidget):
         cli_layout.setContentsMargins(12, 12, 12, 12)
 
         cli_text = QLabel(
-            "Puedes abrir <code>exportacion.py</code> en una consola aparte "
+            "Puedes abrir exportacion.py en una consola aparte "
             "para procesar otro caso ya adquirido."
         )
+        cli_text.setTextFormat(Qt.PlainText)
         cli_text.setWordWrap(True)
         cli_layout.addWidget(cli_text)
 
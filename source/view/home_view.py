@@ -1,4 +1,5 @@
 # source/view/home_view.py
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox, QVBoxLayout as QVLayout
 
 
@@ -10,14 +11,19 @@ class HomeView(QWidget):
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
 
+        # Texto plano (sin motor de rich text); el título va en su propio label
+        title = QLabel("Bienvenido al Android Forensic Extractor")
+        title.setTextFormat(Qt.PlainText)
+        title.setObjectName("SectionTitle")
+        layout.addWidget(title)
+
         lbl = QLabel(
-            "<b>Bienvenido al Android Forensic Extractor</b><br>"
-            "<br>"
-            "Esta interfaz te permite:<br>"
-            "• Ejecutar análisis forense lógico (No-Root) o profundo (Root).<br>"
-            "• Generar exportaciones legibles en CSV y Excel.<br>"
+            "Esta interfaz te permite:\n"
+            "• Ejecutar análisis forense lógico (No-Root) o profundo (Root).\n"
+            "• Generar exportaciones legibles en CSV y Excel.\n"
             "• Configurar automáticamente ADB y dependencias de Python."
         )
+        lbl.setTextFormat(Qt.PlainText)
         lbl.setWordWrap(True)
         layout.addWidget(lbl)
 
@@ -25,12 +31,13 @@ class HomeView(QWidget):
         steps_layout = QVLayout(steps_box)
 
         lbl_steps = QLabel(
-            "1. Ir a la pestaña <b>Configuración</b> y ejecutar <b>Setup</b>.\n"
+            "1. Ir a la pestaña Configuración y ejecutar Setup.\n"
             "2. Conectar el dispositivo Android con depuración USB.\n"
-            "3. En <b>Análisis</b> elegir (No-Root / Root) y opciones de extracción.\n"
+            "3. En Análisis elegir (No-Root / Root) y opciones de extracción.\n"
             "4. Revisar la carpeta del caso: datos crudos y CSV legibles.\n"
-            "5. (Opcional) Usar <b>Exportación</b> para re-exportar manualmente otro caso."
+            "5. (Opcional) Usar Exportación para re-exportar manualmente otro caso."
         )
+        lbl_steps.setTextFormat(Qt.PlainText)
         lbl_steps.setWordWrap(True)
         steps_layout.addWidget(lbl_steps)
 
@@ -1,5 +1,5 @@
 # source/view/settings_view.py
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 
 
@@ -13,15 +13,20 @@ class SettingsView(QWidget):
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(16)
 
+        title = QLabel("Configuración del entorno")
+        title.setTextFormat(Qt.PlainText)
+        title.setObjectName("SectionTitle")
+        layout.addWidget(title)
+
         info = QLabel(
-            "<b>Configuración del entorno</b><br><br>"
-            "Aquí puedes ejecutar <b>setup.py</b> para:\n"
+            "Aquí puedes ejecutar setup.py para:\n"
             "• Verificar Python.\n"
             "• Instalar paquetes necesarios (pandas, PySide6, ...).\n"
             "• Verificar/instalar ADB (platform-tools).\n"
             "• Comprobar Java (opcional para backups .ab).\n\n"
             "El proceso se verá en la misma consola desde donde ejecutaste la interfaz."
         )
+        info.setTextFormat(Qt.PlainText)
         info.setWordWrap(True)
         layout.addWidget(info)
 